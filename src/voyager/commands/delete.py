@@ -8,7 +8,7 @@ import click
 
 from ..click_utils import CONTEXT_SETTINGS
 from ..github import GitHubClient
-from ..utils import check_git_repo, get_repo_info
+from ..utils import check_git_repo, get_repo_info, open_repo
 
 
 @click.command('delete', context_settings=CONTEXT_SETTINGS)
@@ -97,7 +97,7 @@ def delete_release(ctx, tag, force):
                 # Use Git API to delete the tag
                 import git
 
-                local_repo = git.Repo(os.getcwd())
+                local_repo = open_repo(os.getcwd())
 
                 # Try to delete the tag locally
                 try:
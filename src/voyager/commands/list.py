@@ -112,7 +112,7 @@ def pipelines(ctx, limit, concourse_url, concourse_team, concourse_target, pipel
             click.echo(f'Fetching recent builds for {owner}/{repo}...')
 
         # Initialize Concourse client
-        concourse_client = ConcourseClient(
+        concourse_client = ConcourseClient.get(
             api_url=concourse_url, team=concourse_team, target=concourse_target
         )
 
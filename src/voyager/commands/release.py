@@ -7,12 +7,11 @@ from datetime import datetime
 
 import click
 import git
-import semver
 
 from ..click_utils import CONTEXT_SETTINGS
 from ..concourse import ConcourseClient
 from ..github import GitHubClient
-from ..utils import check_git_repo, get_repo_info
+from ..utils import check_git_repo, get_repo_info, open_repo
 
 # Simplified help text
 MERGE_STRATEGY_DESCRIPTIONS = {
@@ -114,7 +113,7 @@ def create_release(
             click.echo(f'Preparing release for {owner}/{repo}...')
 
         # Get the git repo
-        git_repo = git.Repo(os.getcwd())
+        git_repo = open_repo(os.getcwd())
 
         # Get the current branch
         current_branch = git_repo.active_branch.name
@@ -373,6 +372,9 @@ def create_release(
 
         # Calculate new version
         if current_version:
+            # Only the version bump needs semver, so keep it off the CLI's import path
+            import semver
+
             try:
                 if type == 'major':
                     new_version = str(semver.VersionInfo.parse(current_version).bump_major())
@@ -468,7 +470,7 @@ Released on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
             click.echo('Triggering Concourse CI pipeline...')
 
             try:
-                concourse_client = ConcourseClient(
+                concourse_client = ConcourseClient.get(
                     api_url=concourse_url, team=concourse_team, target=concourse_target
                 )
 
@@ -809,9 +811,10 @@ class VersionUpdater:
                 # Generic update using regex pattern
                 new_content = self._update_generic(content)
 
-            # Write the updated content back to the file
-            with open(self.file_path, 'w') as f:
-                f.write(new_content)
+            # Write the updated content back to the file, unless nothing was replaced
+            if new_content != content:
+                with open(self.file_path, 'w') as f:
+                    f.write(new_content)
 
             # If we're on a different branch, commit the changes before switching back
             if switched_branch and self.git_repo:
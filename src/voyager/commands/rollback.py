@@ -11,7 +11,18 @@ import git
 from ..click_utils import CONTEXT_SETTINGS
 from ..concourse import ConcourseClient
 from ..github import GitHubClient
-from ..utils import check_git_repo, get_repo_info
+from ..utils import check_git_repo, get_repo_info, open_repo
+
+# Closing instructions for finishing a rollback, formatted with the rollback branch
+_ADVICE = (
+    "If you want to complete the rollback, merge the '{branch}' branch to your main branch:",
+    '  git checkout main',
+    '  git merge {branch}',
+    '  git push origin main',
+)
+
+# __version__ assignment rewritten by update_version_in_init
+_INIT_VERSION_RE = re.compile(r'__version__\s*=\s*[\'"]([^\'"]*)[\'"]')
 
 
 @click.command('rollback', context_settings=CONTEXT_SETTINGS)
@@ -61,7 +72,7 @@ def rollback(
 
     try:
         owner, repo = get_repo_info()
-        git_repo = git.Repo(os.getcwd())
+        git_repo = open_repo(os.getcwd())
 
         # Check for GitHub authentication - make it optional
         github_authenticated = False
@@ -70,9 +81,9 @@ def rollback(
             github_client = GitHubClient(required=False)
             github_authenticated = github_client.is_authenticated
 
-            # Only fetch releases if we're authenticated
+            # Only fetch releases for the picker, and only if we're authenticated
             releases = []
-            if github_authenticated:
+            if github_authenticated and not tag:
                 releases = github_client.get_releases(owner, repo, per_page=20)
         except Exception as e:
             click.echo(f'Warning: Unable to access GitHub API: {str(e)}', err=True)
@@ -86,31 +97,20 @@ def rollback(
             if releases:
                 click.echo('Available releases for rollback:')
 
-                for idx, release in enumerate(releases, 1):
-                    published_at = release.get('published_at', 'N/A')
-                    if published_at != 'N/A':
-                        date_obj = datetime.strptime(published_at, '%Y-%m-%dT%H:%M:%SZ')
-                        formatted_date = date_obj.strftime('%Y-%m-%d %H:%M')
-                    else:
-                        formatted_date = 'N/A'
-
-                    click.echo(
-                        f'{idx}. {release.get("tag_name")} - '
-                        f'{release.get("name")} ({formatted_date})'
+                # One write for the whole list rather than one per release
+                click.echo(
+                    '\n'.join(
+                        f'{idx}. {release.get("tag_name")} - {release.get("name")} '
+                        f'({format_published_at(release.get("published_at", "N/A"))})'
+                        for idx, release in enumerate(releases, 1)
                     )
+                )
 
-                while True:
-                    choice = click.prompt(
-                        'Enter the number of the release to roll back to', type=int
-                    )
-                    if 1 <= choice <= len(releases):
-                        selected_release = releases[choice - 1]
-                        tag = selected_release.get('tag_name')
-                        break
-                    else:
-                        click.echo(
-                            f'Invalid choice. Please enter a number between 1 and {len(releases)}'
-                        )
+                choice = click.prompt(
+                    'Enter the number of the release to roll back to',
+                    type=click.IntRange(1, len(releases)),
+                )
+                tag = releases[choice - 1].get('tag_name')
             else:
                 # Not authenticated or no releases found, list local tags instead
                 tags = sorted([t.name for t in git_repo.tags], reverse=True)
@@ -122,15 +122,10 @@ def rollback(
                 for idx, t in enumerate(tags, 1):
                     click.echo(f'{idx}. {t}')
 
-                while True:
-                    choice = click.prompt('Enter the number of the tag to roll back to', type=int)
-                    if 1 <= choice <= len(tags):
-                        tag = tags[choice - 1]
-                        break
-                    else:
-                        click.echo(
-                            f'Invalid choice. Please enter a number between 1 and {len(tags)}'
-                        )
+                choice = click.prompt(
+                    'Enter the number of the tag to roll back to', type=click.IntRange(1, len(tags))
+                )
+                tag = tags[choice - 1]
 
         # Validate the tag exists
         try:
@@ -247,8 +242,9 @@ def rollback(
         click.echo('Pushing rollback branch to remote...')
         git_repo.git.push('-f', 'origin', rollback_branch)
 
-        # Create rollback tag
-        rollback_tag = f'rollback-{tag}-{datetime.now().strftime("%Y%m%d%H%M%S")}'
+        # Create rollback tag; the release notes reuse its timestamp so the two always agree
+        rolled_back_at = datetime.now()
+        rollback_tag = f'rollback-{tag}-{rolled_back_at.strftime("%Y%m%d%H%M%S")}'
         click.echo(f'Creating rollback tag: {rollback_tag}')
         git_repo.create_tag(rollback_tag)
         git_repo.git.push('origin', rollback_tag)
@@ -261,7 +257,7 @@ def rollback(
 
 This is a rollback to the previous release {tag}.
 
-Rolled back on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+Rolled back on {rolled_back_at.strftime('%Y-%m-%d %H:%M:%S')}
 """
             try:
                 rollback_release = github_client.create_release(
@@ -288,7 +284,7 @@ Rolled back on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
             click.echo('Triggering Concourse CI rollback pipeline...')
 
             try:
-                concourse_client = ConcourseClient(
+                concourse_client = ConcourseClient.get(
                     api_url=concourse_url, team=concourse_team, target=concourse_target
                 )
 
@@ -307,21 +303,25 @@ Rolled back on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
                 click.echo(f'⚠ Concourse error: {str(e)}', err=True)
                 click.echo('Rollback created successfully, but pipeline trigger failed.')
 
-        # Advice on how to proceed
-        click.echo('\nRollback branch created successfully.')
+        # Advice on how to proceed, written in one go
         click.echo(
-            f"If you want to complete the rollback, merge the '{rollback_branch}' "
-            f'branch to your main branch:'
+            '\nRollback branch created successfully.\n'
+            + '\n'.join(line.format(branch=rollback_branch) for line in _ADVICE)
         )
-        click.echo('  git checkout main')
-        click.echo(f'  git merge {rollback_branch}')
-        click.echo('  git push origin main')
 
     except Exception as e:
         click.echo(f'Error during rollback: {str(e)}', err=True)
         sys.exit(1)
 
 
+def format_published_at(published_at):
+    """Format a GitHub release timestamp for display, or 'N/A' for a draft without one."""
+    if not published_at or published_at == 'N/A':
+        return 'N/A'
+    # fromisoformat only takes a 'Z' suffix on 3.11+, so spell out the UTC offset
+    return datetime.fromisoformat(published_at.replace('Z', '+00:00')).strftime('%Y-%m-%d %H:%M')
+
+
 def find_version_file(repo_root):
     """Find a file containing version information in common locations."""
     # Define common patterns for different file types
@@ -431,12 +431,12 @@ def update_version_in_init(git_repo, version):
         with open(init_file, 'r') as f:
             content = f.read()
 
-        new_content = re.sub(
-            r'__version__\s*=\s*[\'"]([^\'"]*)[\'"]', f"__version__ = '{version}'", content
-        )
+        new_content = _INIT_VERSION_RE.sub(f"__version__ = '{version}'", content, count=1)
 
-        with open(init_file, 'w') as f:
-            f.write(new_content)
+        # Leave the file alone when it already carries this version
+        if new_content != content:
+            with open(init_file, 'w') as f:
+                f.write(new_content)
 
         click.echo(f'Updated version in {init_file}')
 
@@ -1,12 +1,60 @@
 #!/usr/bin/env python3
 
+import functools
+import math
 import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Sequence, Tuple
 
 import click
 import requests
 import yaml
+from requests.adapters import HTTPAdapter
+
+from .utils import loads_json, retry_after_seconds
+
+# Seconds to wait for a connection to Concourse, and then for each response
+CONNECT_TIMEOUT = 5.0
+READ_TIMEOUT = 30.0
+
+# Maximum number of Concourse API requests issued concurrently, to spare the ATC
+MAX_CONCURRENCY = 5
+
+# Retries after the first attempt when Concourse answers with a transient status
+MAX_RETRIES = 3
+
+# Seconds before the first retry when no Retry-After is given, doubling on each attempt up
+# to the maximum; CONCOURSE_POLL_MIN and CONCOURSE_POLL_MAX override them
+RETRY_BACKOFF_MIN = 0.05
+RETRY_BACKOFF_MAX = 30.0
+
+# Statuses for a request refused before it was processed, so even a POST can be resent
+_REFUSED_STATUSES = frozenset({429, 503})
+
+# Transient failures that are only retried for idempotent GETs
+_TRANSIENT_STATUSES = _REFUSED_STATUSES | {500, 502, 504}
+
+# Use the libyaml-backed loader when PyYAML was built with it
+_Loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+
+@functools.lru_cache(maxsize=None)
+def _flyrc_path() -> Path:
+    """Location of the fly CLI config file, resolved once per process."""
+    return Path.home() / '.flyrc'
+
+
+@functools.lru_cache(maxsize=8)
+def _load_flyrc_cached(path: str, mtime_ns: int, size: int):
+    """Parse a flyrc file; cached per path and file version, so edits are picked up."""
+    # Hand libyaml the binary stream directly; it reads incrementally and detects encoding.
+    # fly writes ~/.flyrc as a single YAML document, so yaml.load (not load_all) is enough
+    # and a file with extra documents is rejected as malformed.
+    with open(path, 'rb') as f:
+        return yaml.load(f, Loader=_Loader)
 
 
 def get_flyrc_data(target: str = None) -> Optional[Dict]:
@@ -17,30 +65,30 @@ def get_flyrc_data(target: str = None) -> Optional[Dict]:
         target: Optional target name to filter data
 
     Returns:
-        Dict containing the flyrc data, or None if file doesn't exist or can't be parsed
+        Dict containing the flyrc data, or None if file doesn't exist or can't be parsed.
+        The parsed data is shared between calls and must not be modified.
     """
-    flyrc_path = Path.home() / '.flyrc'
-    if not flyrc_path.exists():
-        return None
-
+    flyrc_path = _flyrc_path()
     try:
-        with open(flyrc_path, 'r') as f:
-            flyrc_data = yaml.safe_load(f)
-
-        if not flyrc_data or 'targets' not in flyrc_data:
-            return None
+        st = flyrc_path.stat()
+        flyrc_data = _load_flyrc_cached(str(flyrc_path), st.st_mtime_ns, st.st_size)
+    except FileNotFoundError:
+        return None
+    except (yaml.YAMLError, IOError) as e:
+        sys.stderr.write(f'Error reading flyrc file: {e}\n')
+        return None
 
-        if target:
-            # Get the specified target data if it exists
-            if target in flyrc_data.get('targets', {}):
-                return {'targets': {target: flyrc_data['targets'][target]}}
-            return None
+    if not flyrc_data or 'targets' not in flyrc_data:
+        return None
 
-        return flyrc_data
-    except (yaml.YAMLError, IOError) as e:
-        click.echo(f'Error reading flyrc file: {e}', err=True)
+    if target:
+        # Get the specified target data if it exists
+        if target in flyrc_data.get('targets', {}):
+            return {'targets': {target: flyrc_data['targets'][target]}}
         return None
 
+    return flyrc_data
+
 
 def get_concourse_data_from_flyrc(target: str) -> Optional[Dict]:
     """
@@ -52,17 +100,17 @@ def get_concourse_data_from_flyrc(target: str) -> Optional[Dict]:
     Returns:
         Dict containing team, api_url, and token if found, None otherwise
     """
-    flyrc_data = get_flyrc_data(target)
-    if not flyrc_data or 'targets' not in flyrc_data or target not in flyrc_data['targets']:
+    # Index the shared parsed data directly rather than building a filtered copy
+    flyrc_data = get_flyrc_data()
+    target_data = flyrc_data and (flyrc_data.get('targets') or {}).get(target)
+    if not target_data:
         return None
 
-    target_data = flyrc_data['targets'][target]
-
     # Extract relevant information
     result = {
         'team': target_data.get('team'),
         'api_url': target_data.get('api'),
-        'token': target_data.get('token', {}).get('value'),
+        'token': (target_data.get('token') or {}).get('value'),
     }
 
     # Ensure we have the minimum required information
@@ -126,12 +174,36 @@ def get_team_from_flyrc(target: str) -> Optional[str]:
 class ConcourseClient:
     """Client for interacting with Concourse CI."""
 
+    __slots__ = (
+        'api_url',
+        'team',
+        'token',
+        'headers',
+        'session',
+        'timeout',
+        'max_retries',
+        'backoff_min',
+        'backoff_max',
+        '_pipelines_api',
+        '_pipelines_ui',
+    )
+
+    _AUTH_PREFIX = 'Bearer '
+
+    # Clients handed out by get(), keyed by every resolved setting that shapes their requests
+    _instances: Dict[Tuple, 'ConcourseClient'] = {}
+
     def __init__(
         self,
         api_url: Optional[str] = None,
         team: Optional[str] = None,
         token: Optional[str] = None,
         target: Optional[str] = None,
+        connect_timeout: float = CONNECT_TIMEOUT,
+        read_timeout: float = READ_TIMEOUT,
+        poll_backoff_min: Optional[float] = None,
+        poll_backoff_max: Optional[float] = None,
+        max_retries: int = MAX_RETRIES,
     ):
         """
         Initialize a Concourse client.
@@ -141,21 +213,15 @@ class ConcourseClient:
             team: Concourse team name (optional if target is provided)
             token: Authentication token (optional if CONCOURSE_TOKEN env var or target is provided)
             target: Name of the target in ~/.flyrc to use for authentication (optional)
+            connect_timeout: Seconds to wait for a connection to the Concourse API
+            read_timeout: Seconds to wait for each response, e.g. raised for slow build starts
+            poll_backoff_min: Seconds before the first retry of a transient failure, doubling
+                after each (defaults to CONCOURSE_POLL_MIN or RETRY_BACKOFF_MIN)
+            poll_backoff_max: Longest wait between retries, including Retry-After
+                (defaults to CONCOURSE_POLL_MAX or RETRY_BACKOFF_MAX)
+            max_retries: Retries after the first attempt of a request
         """
-        # First, try to get info from target in ~/.flyrc if provided
-        target_team = None
-        if target:
-            target_api_url = get_api_url_from_flyrc(target)
-            target_team = get_team_from_flyrc(target)
-            target_token = get_token_from_flyrc(target)
-
-            # Use values from target if not explicitly provided
-            if not api_url and target_api_url:
-                api_url = target_api_url
-            if not team and target_team:
-                team = target_team
-            if not token and target_token:
-                token = target_token
+        api_url, team, token = self._resolve_settings(api_url, team, token, target)
 
         # Validate API URL
         self.api_url = api_url.rstrip('/') if api_url else None
@@ -173,12 +239,26 @@ class ConcourseClient:
                 ' or ensure your ~/.flyrc file contains a valid target with --concourse-target.'
             )
 
-        # Try to get token in priority order:
-        # 1. Explicitly provided token
-        # 2. CONCOURSE_TOKEN environment variable
-        # 3. Token from ~/.flyrc file for the specified target
-        self.token = token or os.environ.get('CONCOURSE_TOKEN')
+        # Explicit backoff settings take priority over the environment
+        self.max_retries = max_retries
+        self.backoff_min, min_name = self._backoff_setting(
+            poll_backoff_min, 'poll_backoff_min', 'CONCOURSE_POLL_MIN', RETRY_BACKOFF_MIN
+        )
+        self.backoff_max, max_name = self._backoff_setting(
+            poll_backoff_max, 'poll_backoff_max', 'CONCOURSE_POLL_MAX', RETRY_BACKOFF_MAX
+        )
+        if self.backoff_min > self.backoff_max:
+            raise ValueError(
+                f'{min_name} ({self.backoff_min:g}s) must not be greater than '
+                f'{max_name} ({self.backoff_max:g}s).'
+            )
+
+        # Every endpoint and build page lives under the team's pipelines
+        self._pipelines_api = f'{self.api_url}/api/v1/teams/{self.team}/pipelines'
+        self._pipelines_ui = f'{self.api_url}/teams/{self.team}/pipelines'
 
+        # Validate token
+        self.token = token
         if not self.token:
             raise ValueError(
                 'Concourse token not found. Please set CONCOURSE_TOKEN environment variable, '
@@ -186,28 +266,162 @@ class ConcourseClient:
                 'for the target specified with --concourse-target.'
             )
 
-        self.headers = {'Authorization': f'Bearer {self.token}', 'Content-Type': 'application/json'}
+        self.headers = {
+            'Authorization': self._AUTH_PREFIX + self.token,
+            'Content-Type': 'application/json',
+        }
+
+        # Requests that outlive these raise requests.exceptions.Timeout rather than hang
+        self.timeout = (connect_timeout, read_timeout)
+
+        # Share one pooled session so consecutive API calls reuse the same connection
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=10)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+    def close(self) -> None:
+        """Close the underlying HTTP session."""
+        self.session.close()
+
+    def __enter__(self) -> 'ConcourseClient':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """Send a request, retrying transient failures after Retry-After or a backoff."""
+        kwargs.setdefault('timeout', self.timeout)
+        retry_statuses = _TRANSIENT_STATUSES if method == 'GET' else _REFUSED_STATUSES
+        for attempt in range(self.max_retries + 1):
+            response = self.session.request(method, url, **kwargs)
+            if response.status_code not in retry_statuses or attempt == self.max_retries:
+                return response
+
+            # Honor the server's Retry-After, otherwise back off exponentially
+            backoff = self.backoff_min * 2**attempt
+            delay = retry_after_seconds(response.headers.get('Retry-After'), backoff)
+            time.sleep(max(0.0, min(delay, self.backoff_max)))
+
+    @staticmethod
+    def _backoff_setting(
+        value: Optional[float], arg_name: str, env_var: str, default: float
+    ) -> Tuple[float, str]:
+        """Resolve a backoff in seconds, clamped to >= 0, with the name it was given by."""
+        name = arg_name
+        if value is None:
+            name = env_var
+            raw = os.environ.get(env_var)
+            if raw is None:
+                return default, name
+            try:
+                value = float(raw)
+            except ValueError:
+                raise ValueError(f'{env_var} must be a number of seconds, got {raw!r}.') from None
+
+        if math.isnan(value):
+            raise ValueError(f'{name} must be a number of seconds, got {value!r}.')
+        return max(float(value), 0.0), name
+
+    @staticmethod
+    def _resolve_settings(
+        api_url: Optional[str],
+        team: Optional[str],
+        token: Optional[str],
+        target: Optional[str],
+    ) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+        """Fill in missing connection settings from the environment and ~/.flyrc."""
+        # Try to get token in priority order, only looking further when still missing:
+        # 1. Explicitly provided token
+        # 2. CONCOURSE_TOKEN environment variable
+        # 3. Token from ~/.flyrc file for the specified target
+        token = token or os.environ.get('CONCOURSE_TOKEN')
+
+        # Fill in anything still missing from the target in ~/.flyrc
+        if target and not (api_url and team and token):
+            target_data = get_concourse_data_from_flyrc(target) or {}
+
+            # Use values from target if not explicitly provided
+            api_url = api_url or target_data.get('api_url')
+            team = team or target_data.get('team')
+            token = token or target_data.get('token')
+
+        return api_url, team, token
+
+    @classmethod
+    def get(
+        cls,
+        api_url: Optional[str] = None,
+        team: Optional[str] = None,
+        token: Optional[str] = None,
+        target: Optional[str] = None,
+        connect_timeout: float = CONNECT_TIMEOUT,
+        read_timeout: float = READ_TIMEOUT,
+        poll_backoff_min: Optional[float] = None,
+        poll_backoff_max: Optional[float] = None,
+        max_retries: int = MAX_RETRIES,
+    ) -> 'ConcourseClient':
+        """
+        Get a shared client for the given settings, creating it on first use.
+
+        Takes the same arguments as the constructor. They are resolved from the environment
+        and ~/.flyrc first, so a target and the explicit values it stands for share a client,
+        while any difference in URL, team, token, timeouts, backoff or retries gets its own.
+
+        Returns:
+            The client previously created for the same settings, or a new one
+        """
+        api_url, team, token = cls._resolve_settings(api_url, team, token, target)
+        backoff_min, _ = cls._backoff_setting(
+            poll_backoff_min, 'poll_backoff_min', 'CONCOURSE_POLL_MIN', RETRY_BACKOFF_MIN
+        )
+        backoff_max, _ = cls._backoff_setting(
+            poll_backoff_max, 'poll_backoff_max', 'CONCOURSE_POLL_MAX', RETRY_BACKOFF_MAX
+        )
+        key = (
+            api_url,
+            team,
+            token,
+            connect_timeout,
+            read_timeout,
+            backoff_min,
+            backoff_max,
+            max_retries,
+        )
+        client = cls._instances.get(key)
+        if client is None:
+            client = cls._instances[key] = cls(
+                api_url,
+                team,
+                token,
+                connect_timeout=connect_timeout,
+                read_timeout=read_timeout,
+                poll_backoff_min=poll_backoff_min,
+                poll_backoff_max=poll_backoff_max,
+                max_retries=max_retries,
+            )
+        return client
 
     def trigger_pipeline(
         self, pipeline_name: str, job_name: str, variables: Dict[str, str] = None
     ) -> bool:
         """Trigger a job in a Concourse pipeline with optional variables."""
-        url = (
-            f'{self.api_url}/api/v1/teams/{self.team}/pipelines/{pipeline_name}/'
-            f'jobs/{job_name}/builds'
-        )
+        url = f'{self._pipelines_api}/{pipeline_name}/jobs/{job_name}/builds'
 
         payload = {}
         if variables:
             payload = {'vars': variables}
 
-        response = requests.post(url, headers=self.headers, json=payload)
+        response = self._request('POST', url, json=payload)
 
         if response.status_code in (200, 201):
-            build_data = response.json()
-            click.echo(f'Pipeline triggered: Build #{build_data.get("id", "Unknown")}')
+            build_data = loads_json(response.content)
+            # Both lines in one write
             click.echo(
-                f'URL: {self.api_url}/teams/{self.team}/pipelines/{pipeline_name}/jobs/{job_name}/'
+                f'Pipeline triggered: Build #{build_data.get("id", "Unknown")}\n'
+                f'URL: {self._pipelines_ui}/{pipeline_name}/jobs/{job_name}/'
                 f'builds/{build_data.get("name", "latest")}'
             )
             return True
@@ -219,15 +433,28 @@ class ConcourseClient:
 
     def get_pipeline_builds(self, pipeline_name: str, limit: int = 5) -> List[Dict]:
         """Get recent builds for a pipeline."""
-        url = f'{self.api_url}/api/v1/teams/{self.team}/pipelines/{pipeline_name}/builds'
+        url = f'{self._pipelines_api}/{pipeline_name}/builds'
         params = {'limit': limit}
 
-        response = requests.get(url, headers=self.headers, params=params)
+        response = self._request('GET', url, params=params)
 
         if response.status_code == 200:
-            return response.json()
+            return loads_json(response.content)
         else:
             click.echo(
                 f'Failed to get pipeline builds: {response.status_code} - {response.text}', err=True
             )
             return []
+
+    def get_pipeline_builds_many(
+        self, pipeline_names: Sequence[str], limit: int = 5
+    ) -> Dict[str, List[Dict]]:
+        """Get recent builds for several pipelines concurrently, keyed by pipeline name."""
+        if len(pipeline_names) <= 1:
+            return {name: self.get_pipeline_builds(name, limit) for name in pipeline_names}
+
+        with ThreadPoolExecutor(max_workers=min(MAX_CONCURRENCY, len(pipeline_names))) as executor:
+            builds = executor.map(
+                lambda name: self.get_pipeline_builds(name, limit), pipeline_names
+            )
+            return dict(zip(pipeline_names, builds))
@@ -1,8 +1,10 @@
 #!/usr/bin/env python3
 
+import fnmatch
 import os
 import subprocess
-from typing import List, Optional
+import tempfile
+from typing import Iterable, List, Optional
 
 
 class GitHelper:
@@ -91,6 +93,49 @@ class GitHelper:
                 version = tag.split(f'{repo}-', 1)[-1] if f'{repo}-' in tag else tag
                 self.info(f'> {version}')
 
+    def _replace_in_files(
+        self, root: str, name_patterns: Iterable[str], old: str, new: str
+    ) -> List[str]:
+        """Replace text in files under root matching any of the name patterns.
+
+        Files that don't contain the old text are never rewritten. Changed files are
+        written to a uniquely named temporary file next to the original, keeping its mode,
+        and swapped in with os.replace; the temporary file is removed if that fails.
+        """
+        old_bytes = old.encode()
+        new_bytes = new.encode()
+        updated = []
+
+        for dirpath, dirnames, filenames in os.walk(root):
+            if '.git' in dirnames:
+                dirnames.remove('.git')
+
+            for filename in filenames:
+                if not any(fnmatch.fnmatch(filename, pattern) for pattern in name_patterns):
+                    continue
+
+                path = os.path.join(dirpath, filename)
+                with open(path, 'rb') as f:
+                    content = f.read()
+                if content.find(old_bytes) == -1:
+                    continue
+
+                # A uniquely named temp file never clobbers a stray one, and is removed if the
+                # write fails so a later 'git add .' can't pick it up
+                mode = os.stat(path).st_mode & 0o777
+                fd, tmp_path = tempfile.mkstemp(dir=dirpath, prefix=f'.{filename}.')
+                try:
+                    with os.fdopen(fd, 'wb') as f:
+                        f.write(content.replace(old_bytes, new_bytes))
+                    os.chmod(tmp_path, mode)
+                    os.replace(tmp_path, path)
+                except BaseException:
+                    os.unlink(tmp_path)
+                    raise
+                updated.append(path)
+
+        return updated
+
     def update_git_release_tag(
         self,
         owner: str,
@@ -191,29 +236,13 @@ class GitHelper:
             to_version = f'v{current_version}'
 
             # Update git_release_tag values
-            find_cmd = (
-                f'find {params_dir} -type f \\( -name "*-{repo_name}.yml" -o '
-                f'-name "*.{repo_name}.yaml" \\) -exec grep -l '
-                f'"git_release_tag: release-{from_version}" {{}} \\;'
-            )
-
-            result = subprocess.run(
-                find_cmd, check=True, shell=True, text=True, capture_output=True
+            self._replace_in_files(
+                params_dir,
+                (f'*-{repo_name}.yml', f'*.{repo_name}.yaml'),
+                f'git_release_tag: release-{from_version}',
+                f'git_release_tag: release-{to_version}',
             )
 
-            files_to_update = result.stdout.strip().split('\n')
-
-            for file_path in files_to_update:
-                if not file_path:
-                    continue
-
-                sed_cmd = (
-                    f'sed -i "s/git_release_tag: release-{from_version}/'
-                    f'git_release_tag: release-{to_version}/g" {file_path}'
-                )
-
-                subprocess.run(sed_cmd, check=True, shell=True)
-
             # Show changes
             subprocess.run(['git', 'status'], check=True, cwd=params_dir)
             subprocess.run(['git', 'diff'], check=True, cwd=params_dir)
@@ -236,26 +265,20 @@ class GitHelper:
 
             subprocess.run(['git', 'commit', '-m', commit_msg], check=True, cwd=params_dir)
 
-            # Merge into master
+            # Merge into master, pulling first so the atomic push below stays a fast-forward
+            # even if master moved on while the changes were being reviewed
             subprocess.run(['git', 'checkout', 'master'], check=True, cwd=params_dir)
             subprocess.run(['git', 'pull', 'origin', 'master'], check=True, cwd=params_dir)
             subprocess.run(['git', 'rebase', branch_name], check=True, cwd=params_dir)
-            subprocess.run(['git', 'push', 'origin', 'master'], check=True, cwd=params_dir)
             subprocess.run(['git', 'branch', '-D', branch_name], check=True, cwd=params_dir)
 
-            # Create and push tag
-            tag_cmd = [
-                'git',
-                'tag',
-                '-a',
-                f'{repo_name}-release-{to_version}',
-                '-m',
-                f'Version {repo_name}-release-{to_version}',
-            ]
+            # Create the tag, then push it together with master in one atomic push
+            release_tag = f'{repo_name}-release-{to_version}'
+            tag_cmd = ['git', 'tag', '-a', release_tag, '-m', f'Version {release_tag}']
             subprocess.run(tag_cmd, check=True, cwd=params_dir)
 
             subprocess.run(
-                ['git', 'push', 'origin', f'{repo_name}-release-{to_version}'],
+                ['git', 'push', '--atomic', 'origin', 'master', f'refs/tags/{release_tag}'],
                 check=True,
                 cwd=params_dir,
             )
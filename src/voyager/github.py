@@ -1,15 +1,46 @@
 #!/usr/bin/env python3
 
 import os
-import urllib3
-from typing import Dict, List, Optional
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+from urllib.parse import parse_qs, urlparse
 
 import requests
+import urllib3
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from .utils import loads_json, retry_after_seconds
+
+# Seconds to wait for the GitHub API before giving up on a request
+REQUEST_TIMEOUT = 10
+
+# Longest the client sleeps for a rate limit before giving up with an error
+MAX_RATE_LIMIT_WAIT = 60
+
+# Seconds waited when a Retry-After header can't be parsed
+DEFAULT_RETRY_AFTER = 1.0
+
+# Maximum number of GitHub API requests issued concurrently by the bulk helpers
+MAX_CONCURRENCY = 8
+
+# Seconds a cached ETag/response pair is revalidated before being refetched outright
+ETAG_CACHE_TTL = 24 * 60 * 60
+
+# Seconds release lookups are served from memory without contacting GitHub at all
+RELEASE_CACHE_TTL = 5 * 60
+
+# Repositories queried per GraphQL request, to stay well under GitHub's node limit
+GRAPHQL_BATCH_SIZE = 50
 
 
 class GitHubClient:
     """Client for interacting with GitHub API."""
 
+    # Whether InsecureRequestWarning has already been silenced in this process
+    _warnings_disabled = False
+
     def __init__(
         self,
         api_url: Optional[str] = None,
@@ -31,6 +62,15 @@ class GitHubClient:
             self.api_url = 'https://api.github.com'
 
         print(f'Using GitHub API URL: {self.api_url}')
+
+        # Every endpoint used lives under the repository's releases collection
+        self._releases_tpl = self.api_url + '/repos/{owner}/{repo}/releases'
+
+        # GitHub Enterprise serves GraphQL at /api/graphql next to the /api/v3 REST root
+        if self.api_url.endswith('/v3'):
+            self._graphql_url = self.api_url[: -len('/v3')] + '/graphql'
+        else:
+            self._graphql_url = self.api_url + '/graphql'
         if not self.token and required:
             raise ValueError(
                 'GitHub token not found. Please set GITHUB_TOKEN environment variable or '
@@ -44,37 +84,272 @@ class GitHubClient:
         if self.token:
             self.headers['Authorization'] = f'token {self.token}'
 
-        if not self.verifySSL:
-            urllib3.disable_warnings()
+        if not self.verifySSL and not GitHubClient._warnings_disabled:
+            urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+            GitHubClient._warnings_disabled = True
 
-    def get_latest_release(self, owner: str, repo: str) -> Dict:
-        """Get the latest release from GitHub API."""
-        url = f'{self.api_url}/repos/{owner}/{repo}/releases/latest'
-        response = requests.get(url, verify=self.verifySSL, headers=self.headers)
+        # Share one pooled session so consecutive calls reuse the same connection
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        self.session.verify = self.verifySSL
+        # Server errors are retried here; 429 is left to _request, which honors Retry-After.
+        # Once retries run out the last response is returned rather than raised.
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=16,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=[500, 502, 503, 504],
+                raise_on_status=False,
+            ),
+        )
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
 
-        if response.status_code == 200:
-            return response.json()
+        # Last seen ETag and body per GET request, for conditional requests
+        self._etag_cache: Dict[Tuple, Tuple[str, object, float]] = {}
+
+        # Recent release lookups per (kind, owner, repo, ...), served until RELEASE_CACHE_TTL
+        self._release_cache: Dict[Tuple, Tuple[float, object]] = {}
+
+        # Reset epoch the next request waits for, once a response has used up the quota
+        self._rate_limit_reset: Optional[str] = None
+
+    def close(self) -> None:
+        """Close the underlying HTTP session."""
+        self.session.close()
+
+    def __enter__(self) -> 'GitHubClient':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """Send a request, backing off when GitHub reports the rate limit is exhausted."""
+        kwargs.setdefault('timeout', REQUEST_TIMEOUT)
+
+        # The previous response used up the quota, so this request would only be refused
+        reset, self._rate_limit_reset = self._rate_limit_reset, None
+        if reset:
+            self._wait_for_rate_limit_reset(reset)
+
+        response = self.session.request(method, url, **kwargs)
+
+        # Secondary rate limits answer 403/429 with Retry-After; wait it out and retry once
+        retry_after = response.headers.get('Retry-After')
+        if response.status_code in (403, 429) and retry_after:
+            delay = retry_after_seconds(retry_after, DEFAULT_RETRY_AFTER)
+            time.sleep(min(delay, MAX_RATE_LIMIT_WAIT))
+            response = self.session.request(method, url, **kwargs)
+
+        # Out of quota: a refused request waits for the window to reset and is sent again,
+        # while one that went through is returned as-is and the next request waits instead
+        reset = response.headers.get('X-RateLimit-Reset')
+        if response.headers.get('X-RateLimit-Remaining') == '0' and reset:
+            if response.status_code in (403, 429):
+                self._wait_for_rate_limit_reset(reset)
+                response = self.session.request(method, url, **kwargs)
+            else:
+                self._rate_limit_reset = reset
+
+        return response
+
+    def _wait_for_rate_limit_reset(self, reset: str) -> None:
+        """Sleep until the rate limit resets at the given epoch, unless that is too far off."""
+        try:
+            wait = max(0.0, int(reset) - time.time())
+        except ValueError:
+            wait = None
+        if wait is None or wait > MAX_RATE_LIMIT_WAIT:
+            raise Exception(
+                f'GitHub API rate limit exhausted; it resets at {reset} (epoch seconds). '
+                'Try again later.'
+            )
+        if wait:
+            print(f'GitHub API rate limit reached, waiting {wait:.0f}s for it to reset')
+            time.sleep(wait)
+
+    def _get_json(self, url: str, error_message: str, params: Optional[Dict] = None):
+        """GET a JSON resource, revalidating a previously seen body with its ETag."""
+        key = (url, tuple(sorted((params or {}).items())))
+        headers = {}
+        cached = self._etag_cache.get(key)
+        if cached and time.monotonic() - cached[2] < ETAG_CACHE_TTL:
+            headers['If-None-Match'] = cached[0]
         else:
-            err_msg = f'Failed to get latest release: {response.status_code} - {response.text}'
-            raise Exception(err_msg)
+            cached = None
+
+        response = self._request('GET', url, params=params, headers=headers)
 
-    def get_releases(self, owner: str, repo: str) -> List[Dict]:
-        """Get all releases for a repository."""
-        url = f'{self.api_url}/repos/{owner}/{repo}/releases'
-        response = requests.get(url, verify=self.verifySSL, headers=self.headers)
+        if response.status_code == 304 and cached:
+            return cached[1]
         if response.status_code == 200:
-            return response.json()
-        raise Exception(f'Failed to get releases: {response.status_code} - {response.text}')
+            data = loads_json(response.content)
+            etag = response.headers.get('ETag')
+            if etag:
+                self._etag_cache[key] = (etag, data, time.monotonic())
+            return data
+        raise Exception(f'{error_message}: {response.status_code} - {response.text}')
+
+    def _cached(self, key: Tuple, fetch):
+        """Return a recent result for key, or call fetch() and remember its result."""
+        hit = self._release_cache.get(key)
+        if hit and time.monotonic() - hit[0] < RELEASE_CACHE_TTL:
+            return hit[1]
+
+        data = fetch()
+        self._release_cache[key] = (time.monotonic(), data)
+        return data
+
+    def invalidate(self, owner: str, repo: str) -> None:
+        """Forget cached release lookups for a repository."""
+        # Iterate a snapshot, since delete_many's workers add and drop keys concurrently
+        for key in [key for key in list(self._release_cache) if key[1:3] == (owner, repo)]:
+            self._release_cache.pop(key, None)
+
+    def get_latest_release(self, owner: str, repo: str) -> Dict:
+        """Get the latest release from GitHub API."""
+        url = self._releases_tpl.format(owner=owner, repo=repo) + '/latest'
+        return self._cached(
+            ('latest', owner, repo), lambda: self._get_json(url, 'Failed to get latest release')
+        )
+
+    def get_releases(self, owner: str, repo: str, per_page: int = 100) -> List[Dict]:
+        """Get releases for a repository (one page of up to per_page, max 100)."""
+        url = self._releases_tpl.format(owner=owner, repo=repo)
+        params = {'per_page': max(1, min(per_page, 100))}
+        return self._cached(
+            ('releases', owner, repo, params['per_page']),
+            lambda: self._get_json(url, 'Failed to get releases', params=params),
+        )
+
+    def list_all_releases(self, owner: str, repo: str) -> List[Dict]:
+        """Get every release for a repository, fetching the remaining pages concurrently."""
+        url = self._releases_tpl.format(owner=owner, repo=repo)
+        response = self._request('GET', url, params={'per_page': 100, 'page': 1})
+        if response.status_code != 200:
+            raise Exception(f'Failed to get releases: {response.status_code} - {response.text}')
+
+        releases = loads_json(response.content)
+        last_url = response.links.get('last', {}).get('url')
+        if not last_url:
+            return releases
+
+        last_page = int(parse_qs(urlparse(last_url).query)['page'][0])
+
+        def get_page(page: int) -> List[Dict]:
+            params = {'per_page': 100, 'page': page}
+            return self._get_json(url, 'Failed to get releases', params=params)
+
+        with ThreadPoolExecutor(max_workers=min(MAX_CONCURRENCY, last_page - 1)) as executor:
+            for page in executor.map(get_page, range(2, last_page + 1)):
+                releases.extend(page)
+
+        return releases
+
+    def iter_release_ids(self, owner: str, repo: str) -> Iterator[int]:
+        """Yield the ID of every release for a repository, one page in memory at a time."""
+        url = self._releases_tpl.format(owner=owner, repo=repo)
+        params = {'per_page': 100}
+        while url:
+            response = self._request('GET', url, params=params)
+            if response.status_code != 200:
+                raise Exception(f'Failed to get releases: {response.status_code} - {response.text}')
+
+            for release in loads_json(response.content):
+                yield release['id']
+
+            # The next link already carries the query string
+            url = response.links.get('next', {}).get('url')
+            params = None
+
+    def get_releases_many(self, repos: Sequence[Tuple[str, str]]) -> List[List[Dict]]:
+        """Get releases for several (owner, repo) pairs concurrently, in input order."""
+        if len(repos) <= 1:
+            return [self.get_releases(owner, repo) for owner, repo in repos]
+
+        with ThreadPoolExecutor(max_workers=min(MAX_CONCURRENCY, len(repos))) as executor:
+            return list(executor.map(lambda pair: self.get_releases(*pair), repos))
+
+    def get_latest_releases_graphql(self, repos: Sequence[Tuple[str, str]]) -> List[Optional[Dict]]:
+        """Get the latest release of several repositories with batched GraphQL queries.
+
+        Returns one entry per (owner, repo) pair in input order, using the REST field names
+        tag_name, name and body, or None when the repository has no release.
+        """
+        results: List[Optional[Dict]] = []
+        for start in range(0, len(repos), GRAPHQL_BATCH_SIZE):
+            batch = repos[start : start + GRAPHQL_BATCH_SIZE]
+            params = ', '.join(f'$o{i}: String!, $n{i}: String!' for i in range(len(batch)))
+            fields = ' '.join(
+                f'r{i}: repository(owner: $o{i}, name: $n{i}) '
+                '{ latestRelease { tagName name description } }'
+                for i in range(len(batch))
+            )
+            variables = {}
+            for i, (owner, repo) in enumerate(batch):
+                variables[f'o{i}'] = owner
+                variables[f'n{i}'] = repo
+
+            response = self._request(
+                'POST',
+                self._graphql_url,
+                json={'query': f'query({params}) {{ {fields} }}', 'variables': variables},
+            )
+            payload = loads_json(response.content) if response.status_code == 200 else {}
+            if 'data' not in payload:
+                raise Exception(
+                    f'Failed to get latest releases: {response.status_code} - {response.text}'
+                )
+
+            for i in range(len(batch)):
+                release = (payload['data'].get(f'r{i}') or {}).get('latestRelease')
+                results.append(
+                    {
+                        'tag_name': release['tagName'],
+                        'name': release['name'],
+                        'body': release['description'],
+                    }
+                    if release
+                    else None
+                )
+        return results
 
     def delete_release(self, owner: str, repo: str, release_id: int) -> bool:
         """Delete a release by ID."""
-        url = f'{self.api_url}/repos/{owner}/{repo}/releases/{release_id}'
-        response = requests.delete(url, verify=self.verifySSL, headers=self.headers)
+        url = self._releases_tpl.format(owner=owner, repo=repo) + f'/{release_id}'
+        response = self._request('DELETE', url)
+        self.invalidate(owner, repo)
         if response.status_code == 204:
             return True
-        self.error(f'Failed to delete release: {response.status_code} - {response.text}')
+        print(f'Failed to delete release: {response.status_code} - {response.text}')
         return False
 
+    def delete_many(self, owner: str, repo: str, release_ids: Sequence[int]) -> Dict[int, bool]:
+        """Delete several releases concurrently, returning whether each deletion succeeded.
+
+        A deletion that raises is reported as False, so one failure doesn't lose the others.
+        """
+        if not release_ids:
+            return {}
+
+        results = {}
+        with ThreadPoolExecutor(max_workers=min(MAX_CONCURRENCY, len(release_ids))) as executor:
+            futures = {
+                executor.submit(self.delete_release, owner, repo, release_id): release_id
+                for release_id in release_ids
+            }
+            for future in as_completed(futures):
+                release_id = futures[future]
+                try:
+                    results[release_id] = future.result()
+                except Exception as e:
+                    print(f'Failed to delete release {release_id}: {e}')
+                    results[release_id] = False
+        return results
+
     def create_release(
         self,
         owner: str,
@@ -86,7 +361,7 @@ class GitHubClient:
         prerelease: bool = False,
     ) -> Dict:
         """Create a new release on GitHub."""
-        url = f'{self.api_url}/repos/{owner}/{repo}/releases'
+        url = self._releases_tpl.format(owner=owner, repo=repo)
 
         payload = {
             'tag_name': tag_name,
@@ -96,9 +371,10 @@ class GitHubClient:
             'prerelease': prerelease,
         }
 
-        response = requests.post(url, verify=self.verifySSL, headers=self.headers, json=payload)
+        response = self._request('POST', url, json=payload)
+        self.invalidate(owner, repo)
 
         if response.status_code in (200, 201):
-            return response.json()
+            return loads_json(response.content)
         else:
-            raise Exception(f'Failed to create release: {response.status_code} - {response.text}')
\ No newline at end of file
+            raise Exception(f'Failed to create release: {response.status_code} - {response.text}')
@@ -2,6 +2,7 @@
 
 import os
 import subprocess
+import sys
 
 
 class PipelineRunner:
@@ -26,36 +27,22 @@ class PipelineRunner:
         self.repo = repo
         self.pipeline = pipeline
 
-        # If repo is a path, use it directly, otherwise try to find the CI directory
-        if os.path.exists(repo):
-            self.repo_ci_dir = repo
-        else:
-            # Try common CI directory locations
-            possible_paths = [
-                os.path.expanduser(f'~/git/{repo}/ci'),
-                os.path.join(repo, 'ci'),
-                os.path.join(os.getcwd(), 'ci'),
-            ]
-
-            # Find the first existing CI directory
-            for path in possible_paths:
-                if os.path.exists(path):
-                    self.repo_ci_dir = path
-                    break
-            else:
-                raise ValueError(f'Could not find CI directory for repository: {repo}')
-
-        # Validate that the CI directory exists
-        if not os.path.exists(self.repo_ci_dir):
-            raise ValueError(f'CI directory does not exist: {self.repo_ci_dir}')
+        # If repo is a path, use it directly, otherwise try common CI directory locations
+        possible_paths = (
+            repo,
+            os.path.expanduser(f'~/git/{repo}/ci'),
+            os.path.join(repo, 'ci'),
+            os.path.join(os.getcwd(), 'ci'),
+        )
+        self.repo_ci_dir = next((path for path in possible_paths if os.path.isdir(path)), None)
+        if self.repo_ci_dir is None:
+            raise ValueError(f'Could not find CI directory for repository: {repo}')
 
         # Check for any fly script in the CI directory
         fly_scripts = [
-            f
-            for f in os.listdir(self.repo_ci_dir)
-            if f.startswith('fly')
-            and os.path.isfile(os.path.join(self.repo_ci_dir, f))
-            and os.access(os.path.join(self.repo_ci_dir, f), os.X_OK)
+            entry.name
+            for entry in os.scandir(self.repo_ci_dir)
+            if entry.name.startswith('fly') and entry.is_file() and os.access(entry.path, os.X_OK)
         ]
 
         if not fly_scripts:
@@ -64,6 +51,9 @@ class PipelineRunner:
         # Store the first fly script we found
         self.fly_script = os.path.join(self.repo_ci_dir, fly_scripts[0])
 
+        # The CI directory was just found on disk; skip re-checking it until invalidated
+        self._ci_verified = True
+
     def info(self, message: str) -> None:
         """Print info message in cyan color."""
         print(f'{self.CYAN}{message}{self.NOCOLOR}')
@@ -80,36 +70,54 @@ class PipelineRunner:
         """Print completed message in green color."""
         print(f'{self.GREEN}{message}{self.NOCOLOR}')
 
+    def invalidate_ci_cache(self) -> None:
+        """Force the next CI directory verification to check the filesystem again."""
+        self._ci_verified = False
+
     def _verify_ci_directory(self) -> bool:
         """Verify that the CI directory exists."""
-        if not os.path.exists(self.repo_ci_dir):
+        if self._ci_verified:
+            return True
+        if not os.path.isdir(self.repo_ci_dir):
             self.error(f'Repository CI directory not found at {self.repo_ci_dir}')
             return False
+        self._ci_verified = True
         return True
 
+    @staticmethod
+    def _is_interactive() -> bool:
+        """Whether someone is at a terminal to pause for, i.e. stdin is a tty and not in CI."""
+        return sys.stdin.isatty() and not os.environ.get('CI')
+
     def _get_user_confirmation(self, message: str, default: str = 'n') -> bool:
-        """Get user confirmation for an action."""
+        """Get user confirmation for an action, using the default once stdin is exhausted."""
         prompt = (
             f'Do you want to continue? (y/{default}): '
             if default == 'n'
             else 'Do you want to continue? (y/n): '
         )
-        user_input = input(prompt)
+        try:
+            # Piped answers (e.g. `echo y | voyager ...`) are read just like typed ones
+            user_input = input(prompt)
+        except EOFError:
+            print()
+            self.warn(f'No answer on stdin to "{message}"; using the default ({default})')
+            user_input = default
         return user_input.lower().startswith('y')
 
-    def _run_fly_script(self, command: str) -> bool:
-        """Run the fly script with the provided command.
+    def _run_fly_script(self, *args: str) -> bool:
+        """Run the fly script with the provided arguments.
 
         Args:
-            command: The command to run with the fly script (e.g., '-f "foundation" -r "message"')
+            *args: Arguments for the fly script (e.g., '-f', 'foundation', '-r', 'message')
 
         Returns:
             bool: True if the command executed successfully, False otherwise
         """
         try:
-            # Construct and run the command
-            fly_cmd = f'echo "y" | {self.fly_script} {command}'
-            subprocess.run(fly_cmd, check=True, shell=True, cwd=self.repo_ci_dir)
+            # Run the script directly, answering its confirmation prompt on stdin; the
+            # arguments are passed as-is, so quotes in a release message need no escaping
+            subprocess.run([self.fly_script, *args], input=b'y\n', check=True, cwd=self.repo_ci_dir)
             return True
         except subprocess.CalledProcessError as e:
             self.error(f'Error running fly script: {e}')
@@ -191,36 +199,39 @@ class PipelineRunner:
             # Print info and get confirmation
             self.info(f'Running {self.pipeline} pipeline...')
             if not self._get_user_confirmation(f'Continue with {pipeline_type} pipeline?'):
+                self.warn(f'Not running the {pipeline_type} pipeline: it was not confirmed')
                 return False
 
             # Verify CI directory exists
             if not self._verify_ci_directory():
                 return False
 
-            # Define pipeline steps based on type
+            # Define pipeline steps based on type; each step only runs if the previous succeeded
             if pipeline_type == 'release':
                 steps = [
-                    self._run_fly_script(f'-f "{self.foundation}" -r "{message_body}"'),
-                    self._unpause_pipeline(),
-                    self._trigger_job('create-final-release'),
-                    self._watch_job('create-final-release'),
+                    lambda: self._run_fly_script('-f', self.foundation, '-r', message_body),
+                    self._unpause_pipeline,
+                    lambda: self._trigger_job('create-final-release'),
+                    lambda: self._watch_job('create-final-release'),
                 ]
             elif pipeline_type == 'set':
                 steps = [
-                    self._run_fly_script(f'-f "{self.foundation}" -s'),
-                    self._unpause_pipeline(),
-                    self._trigger_job('set-release-pipeline', watch=True),
+                    lambda: self._run_fly_script('-f', self.foundation, '-s'),
+                    self._unpause_pipeline,
+                    lambda: self._trigger_job('set-release-pipeline', watch=True),
                 ]
             else:
                 self.error(f'Invalid pipeline type: {pipeline_type}')
                 return False
 
-            # Run pipeline steps
-            if not all(steps):
-                return False
+            # Run pipeline steps, stopping at the first failure
+            for step in steps:
+                if not step():
+                    return False
 
             # Wait for user confirmation
-            input('Press enter to continue')
+            if self._is_interactive():
+                input('Press enter to continue')
 
             # Pull latest changes for release pipeline
             if pipeline_type == 'release':
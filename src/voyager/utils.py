@@ -1,33 +1,140 @@
 #!/usr/bin/env python3
 
+import json
+import math
 import os
-import re
-from typing import Tuple
+import string
+import subprocess
+import time
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from typing import Optional, Tuple
 
 import git
 
+try:
+    # Optional faster JSON decoder; falls back to the standard library when not installed
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+# Characters GitHub allows in owner and repository names
+_NAME_CHARS = frozenset(string.ascii_letters + string.digits + '_.-')
+
+
+def loads_json(content: bytes):
+    """Decode a JSON response body, using orjson when it is available."""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def retry_after_seconds(value: Optional[str], default: float) -> float:
+    """Seconds to wait for a Retry-After header given as seconds or as an HTTP date.
+
+    A missing or unparsable header waits the default instead; the result is never negative.
+    """
+    if not value:
+        return default
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            seconds = parsedate_to_datetime(value).timestamp() - time.time()
+        except (TypeError, ValueError):
+            return default
+    if not math.isfinite(seconds):
+        return default
+    return max(0.0, seconds)
+
+
+@lru_cache(maxsize=8)
+def open_repo(path: str) -> git.Repo:
+    """Open the git repository at path, reusing the Repo for repeated calls.
+
+    Later lookups in the same directory reuse the Repo rather than rediscovering and parsing
+    .git again. Failed opens raise and are not cached.
+    """
+    return git.Repo(path)
+
+
+def _read_origin_url(cwd: str) -> Optional[str]:
+    """Read the origin remote's URL from the repository config, or None if it isn't set."""
+    try:
+        # One git call reads the config; GitPython would build a Remote and shell out anyway.
+        # --git-dir pins it to cwd/.git, as check_git_repo and open_repo only look there too,
+        # rather than letting git search the parent directories.
+        git_dir = os.path.join(cwd, '.git')
+        result = subprocess.run(
+            ['git', f'--git-dir={git_dir}', 'config', '--local', '--get', 'remote.origin.url'],
+            cwd=cwd,
+            capture_output=True,
+            text=True,
+        )
+    except FileNotFoundError:
+        # No git executable on PATH, so parse the config with GitPython instead
+        reader = open_repo(cwd).config_reader()
+        return reader.get('remote "origin"', 'url', fallback=None)
+
+    # git exits with 1 when the key is unset, and 128 outside a repository
+    if result.returncode == 128:
+        raise git.InvalidGitRepositoryError(cwd)
+    return result.stdout.strip() or None
+
+
+def _parse_github_url(url: str) -> Optional[Tuple[str, str]]:
+    """Split an SSH or HTTPS GitHub remote URL into owner and repository name.
+
+    The host is a fixed literal, so plain string operations do the job without a regex; a
+    .git suffix and any trailing path, query or fragment are dropped.
+    """
+    start = url.lower().find('github.com')
+    if start < 0:
+        return None
+
+    # The host is followed by ':' in SSH URLs and '/' in HTTPS ones
+    rest = url[start + len('github.com') :]
+    if rest[:1] not in (':', '/'):
+        return None
+
+    owner, sep, repo = rest[1:].partition('/')
+    for delimiter in '/?#':
+        repo = repo.partition(delimiter)[0]
+    if repo.endswith('.git'):
+        repo = repo[: -len('.git')]
+
+    if not (sep and owner and repo) or not _NAME_CHARS.issuperset(owner + repo):
+        return None
+    return owner, repo
+
 
 def get_repo_info() -> Tuple[str, str]:
     """Extract owner and repo name from git remote URL."""
     try:
-        repo = git.Repo(os.getcwd())
-        for remote in repo.remotes:
-            if remote.name == 'origin':
-                url = next(remote.urls)
-                # Handle SSH or HTTPS URL formats
-                match = re.search(r'github\.com[:/]([^/]+)/([^/.]+)', url)
-                if match:
-                    return match.group(1), match.group(2)
-
-        raise ValueError('Not a GitHub repository or missing origin remote')
+        url = _read_origin_url(os.getcwd())
     except (git.InvalidGitRepositoryError, git.NoSuchPathError) as err:
         raise ValueError('Current directory is not a git repository') from err
 
+    # Handle SSH or HTTPS URL formats
+    repo_info = url and _parse_github_url(url)
+    if not repo_info:
+        raise ValueError('Not a GitHub repository or missing origin remote')
+    return repo_info
+
 
 def check_git_repo() -> bool:
-    """Check if the current directory is a git repository."""
+    """Check if the current directory is a git repository.
+
+    Looks for the .git directory (or worktree file) with a single stat. Set
+    VOYAGER_STRICT_GIT_CHECK to open the repository with GitPython instead, which also
+    rejects a broken .git.
+    """
+    cwd = os.getcwd()
+    if not os.environ.get('VOYAGER_STRICT_GIT_CHECK'):
+        return os.path.exists(os.path.join(cwd, '.git'))
+
     try:
-        git.Repo(os.getcwd())
+        open_repo(cwd)
         return True
     except (git.InvalidGitRepositoryError, git.NoSuchPathError):
         return False
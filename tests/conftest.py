@@ -0,0 +1,65 @@
+import pytest
+from click.testing import CliRunner
+
+# Import the command modules up front so their import chain (click, git, requests) is paid
+# once during collection rather than by whichever test happens to patch them first.
+import voyager.commands.delete  # noqa: F401
+import voyager.commands.init  # noqa: F401
+from voyager.utils import open_repo
+
+# Releases returned by the mocked GitHub client
+MOCK_RELEASES = [
+    {
+        'id': 1,
+        'tag_name': 'v1.0.0',
+        'name': 'Release 1.0.0',
+        'published_at': '2023-01-01T00:00:00Z',
+        'author': {'login': 'testuser'},
+        'html_url': 'https://github.com/test-owner/test-repo/releases/tag/v1.0.0',
+    },
+    {
+        'id': 2,
+        'tag_name': 'v1.1.0',
+        'name': 'Release 1.1.0',
+        'published_at': '2023-02-01T00:00:00Z',
+        'author': {'login': 'testuser'},
+        'html_url': 'https://github.com/test-owner/test-repo/releases/tag/v1.1.0',
+    },
+]
+
+# Builds returned by the mocked Concourse client
+MOCK_BUILDS = [
+    {
+        'name': '42',
+        'job_name': 'build-and-release',
+        'status': 'succeeded',
+        'start_time': '2023-03-01T10:00:00Z',
+        'end_time': '2023-03-01T10:05:00Z',
+    },
+    {
+        'name': '41',
+        'job_name': 'build-and-release',
+        'status': 'failed',
+        'start_time': '2023-02-28T15:00:00Z',
+        'end_time': '2023-02-28T15:03:00Z',
+    },
+]
+
+
+@pytest.fixture(scope='session')
+def runner():
+    """CLI runner shared by every test; invoke() keeps no state between calls."""
+    return CliRunner()
+
+
+@pytest.fixture
+def isolated_cwd(tmp_path, monkeypatch):
+    """Run from an empty directory, so a git call that escapes its patch can't touch this repo."""
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+@pytest.fixture(autouse=True)
+def clear_repo_cache():
+    """Forget repos cached by earlier tests; they may be another module's git.Repo mock."""
+    open_repo.cache_clear()
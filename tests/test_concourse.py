@@ -1,12 +1,18 @@
+import json
 import os
-from pathlib import Path
-from unittest.mock import mock_open, patch
+from unittest.mock import MagicMock, patch
 
 import pytest
+import requests
 import yaml
 
 from voyager.concourse import (
+    CONNECT_TIMEOUT,
+    MAX_RETRIES,
+    READ_TIMEOUT,
+    RETRY_BACKOFF_MIN,
     ConcourseClient,
+    _flyrc_path,
     get_api_url_from_flyrc,
     get_concourse_data_from_flyrc,
     get_flyrc_data,
@@ -14,6 +20,9 @@ from voyager.concourse import (
     get_token_from_flyrc,
 )
 
+# Pipelines queried together by the bulk builds helper
+PIPELINES = ('build', 'deploy', 'smoke-test')
+
 
 def create_sample_flyrc_content():
     """Create sample flyrc content for testing."""
@@ -38,182 +47,174 @@ def create_sample_flyrc_content():
     }
 
 
-def test_get_flyrc_data():
+@pytest.fixture
+def flyrc_home(tmp_path):
+    """Write the sample flyrc file into a temporary home directory."""
+    (tmp_path / '.flyrc').write_text(yaml.dump(create_sample_flyrc_content()))
+    _flyrc_path.cache_clear()
+    with patch('voyager.concourse.Path.home', return_value=tmp_path):
+        yield tmp_path
+    _flyrc_path.cache_clear()
+
+
+def test_get_flyrc_data(flyrc_home):
     """Test reading and filtering flyrc data."""
     flyrc_content = create_sample_flyrc_content()
-    flyrc_yaml = yaml.dump(flyrc_content)
 
-    # Mock the home directory and file open
-    with patch('voyager.concourse.Path.home') as mock_home, patch(
-        'voyager.concourse.Path.exists', return_value=True
-    ), patch('builtins.open', mock_open(read_data=flyrc_yaml)):
-        mock_home.return_value = Path('/mock/home')
+    # Test getting all data
+    data = get_flyrc_data()
+    assert data == flyrc_content
 
-        # Test getting all data
-        data = get_flyrc_data()
-        assert data == flyrc_content
+    # Test filtering by target
+    data = get_flyrc_data('example')
+    assert 'targets' in data
+    assert 'example' in data['targets']
+    assert len(data['targets']) == 1
 
-        # Test filtering by target
-        data = get_flyrc_data('example')
-        assert 'targets' in data
-        assert 'example' in data['targets']
-        assert len(data['targets']) == 1
+    # Test with non-existent target
+    data = get_flyrc_data('non-existent')
+    assert data is None
 
-        # Test with non-existent target
-        data = get_flyrc_data('non-existent')
-        assert data is None
 
-
-def test_get_concourse_data_from_flyrc():
+def test_get_concourse_data_from_flyrc(flyrc_home):
     """Test extraction of Concourse data from flyrc file."""
-    flyrc_content = create_sample_flyrc_content()
-    flyrc_yaml = yaml.dump(flyrc_content)
-
-    # Mock the home directory and file open
-    with patch('voyager.concourse.Path.home') as mock_home, patch(
-        'voyager.concourse.Path.exists', return_value=True
-    ), patch('builtins.open', mock_open(read_data=flyrc_yaml)):
-        mock_home.return_value = Path('/mock/home')
-
-        # Test with existing target
-        data = get_concourse_data_from_flyrc('example')
-        assert data['team'] == 'main'
-        assert data['api_url'] == 'https://concourse.example.com'
-        assert data['token'] == 'sample-token-main'
-
-        # Test with another target
-        data = get_concourse_data_from_flyrc('another')
-        assert data['team'] == 'development'
-        assert data['api_url'] == 'https://concourse.another.com'
-        assert data['token'] == 'sample-token-dev'
-
-        # Test with target that exists but has no token
-        data = get_concourse_data_from_flyrc('no-token')
-        assert data['team'] == 'test'
-        assert data['api_url'] == 'https://concourse.test.com'
-        assert data['token'] is None
-
-        # Test with non-existent target
-        data = get_concourse_data_from_flyrc('non-existent')
-        assert data is None
-
-
-def test_get_token_from_flyrc():
-    """Test extraction of token from flyrc file."""
-    flyrc_content = create_sample_flyrc_content()
-    flyrc_yaml = yaml.dump(flyrc_content)
+    # Test with existing target
+    data = get_concourse_data_from_flyrc('example')
+    assert data['team'] == 'main'
+    assert data['api_url'] == 'https://concourse.example.com'
+    assert data['token'] == 'sample-token-main'
 
-    # Mock the home directory and file open
-    with patch('voyager.concourse.Path.home') as mock_home, patch(
-        'voyager.concourse.Path.exists', return_value=True
-    ), patch('builtins.open', mock_open(read_data=flyrc_yaml)):
-        mock_home.return_value = Path('/mock/home')
+    # Test with another target
+    data = get_concourse_data_from_flyrc('another')
+    assert data['team'] == 'development'
+    assert data['api_url'] == 'https://concourse.another.com'
+    assert data['token'] == 'sample-token-dev'
 
-        # Test with existing target
-        token = get_token_from_flyrc('example')
-        assert token == 'sample-token-main'
+    # Test with target that exists but has no token
+    data = get_concourse_data_from_flyrc('no-token')
+    assert data['team'] == 'test'
+    assert data['api_url'] == 'https://concourse.test.com'
+    assert data['token'] is None
 
-        # Test with another target
-        token = get_token_from_flyrc('another')
-        assert token == 'sample-token-dev'
+    # Test with non-existent target
+    data = get_concourse_data_from_flyrc('non-existent')
+    assert data is None
 
-        # Test with target that exists but has no token
-        token = get_token_from_flyrc('no-token')
-        assert token is None
 
-        # Test with non-existent target
-        token = get_token_from_flyrc('non-existent')
-        assert token is None
+def test_get_concourse_data_from_flyrc_empty_token(flyrc_home):
+    """Test a target whose token entry is present but empty."""
+    flyrc = {'targets': {'example': {'api': 'https://concourse.example.com', 'team': 'main'}}}
+    flyrc['targets']['example']['token'] = None
+    (flyrc_home / '.flyrc').write_text(yaml.dump(flyrc))
 
+    data = get_concourse_data_from_flyrc('example')
+    assert data == {'team': 'main', 'api_url': 'https://concourse.example.com', 'token': None}
 
-def test_get_api_url_from_flyrc():
-    """Test extraction of API URL from flyrc file."""
-    flyrc_content = create_sample_flyrc_content()
-    flyrc_yaml = yaml.dump(flyrc_content)
 
-    # Mock the home directory and file open
-    with patch('voyager.concourse.Path.home') as mock_home, patch(
-        'voyager.concourse.Path.exists', return_value=True
-    ), patch('builtins.open', mock_open(read_data=flyrc_yaml)):
-        mock_home.return_value = Path('/mock/home')
+def test_get_token_from_flyrc(flyrc_home):
+    """Test extraction of token from flyrc file."""
+    # Test with existing target
+    token = get_token_from_flyrc('example')
+    assert token == 'sample-token-main'
+
+    # Test with another target
+    token = get_token_from_flyrc('another')
+    assert token == 'sample-token-dev'
 
-        # Test with existing target
-        url = get_api_url_from_flyrc('example')
-        assert url == 'https://concourse.example.com'
+    # Test with target that exists but has no token
+    token = get_token_from_flyrc('no-token')
+    assert token is None
 
-        # Test with another target
-        url = get_api_url_from_flyrc('another')
-        assert url == 'https://concourse.another.com'
+    # Test with non-existent target
+    token = get_token_from_flyrc('non-existent')
+    assert token is None
 
-        # Test with target that has no token but has URL
-        url = get_api_url_from_flyrc('no-token')
-        assert url == 'https://concourse.test.com'
 
-        # Test with non-existent target
-        url = get_api_url_from_flyrc('non-existent')
-        assert url is None
+def test_get_api_url_from_flyrc(flyrc_home):
+    """Test extraction of API URL from flyrc file."""
+    # Test with existing target
+    url = get_api_url_from_flyrc('example')
+    assert url == 'https://concourse.example.com'
+
+    # Test with another target
+    url = get_api_url_from_flyrc('another')
+    assert url == 'https://concourse.another.com'
+
+    # Test with target that has no token but has URL
+    url = get_api_url_from_flyrc('no-token')
+    assert url == 'https://concourse.test.com'
 
+    # Test with non-existent target
+    url = get_api_url_from_flyrc('non-existent')
+    assert url is None
 
-def test_get_team_from_flyrc():
+
+def test_get_team_from_flyrc(flyrc_home):
     """Test extraction of team name from flyrc file."""
-    flyrc_content = create_sample_flyrc_content()
-    flyrc_yaml = yaml.dump(flyrc_content)
+    # Test with existing target
+    team = get_team_from_flyrc('example')
+    assert team == 'main'
 
-    # Mock the home directory and file open
-    with patch('voyager.concourse.Path.home') as mock_home, patch(
-        'voyager.concourse.Path.exists', return_value=True
-    ), patch('builtins.open', mock_open(read_data=flyrc_yaml)):
-        mock_home.return_value = Path('/mock/home')
+    # Test with another target
+    team = get_team_from_flyrc('another')
+    assert team == 'development'
 
-        # Test with existing target
-        team = get_team_from_flyrc('example')
-        assert team == 'main'
+    # Test with target that has a team but no token
+    team = get_team_from_flyrc('no-token')
+    assert team == 'test'
 
-        # Test with another target
-        team = get_team_from_flyrc('another')
-        assert team == 'development'
+    # Test with non-existent target
+    team = get_team_from_flyrc('non-existent')
+    assert team is None
 
-        # Test with target that has a team but no token
-        team = get_team_from_flyrc('no-token')
-        assert team == 'test'
 
-        # Test with non-existent target
-        team = get_team_from_flyrc('non-existent')
-        assert team is None
+def test_get_flyrc_data_parses_once(flyrc_home):
+    """Test that the flyrc file is parsed once and re-read after it changes."""
+    with patch('voyager.concourse.yaml.load', wraps=yaml.load) as mock_load:
+        get_token_from_flyrc('example')
+        get_api_url_from_flyrc('example')
+        get_team_from_flyrc('example')
+        assert mock_load.call_count == 1
 
+        (flyrc_home / '.flyrc').write_text(
+            yaml.dump({'targets': {'example': {'api': 'https://new.example.com', 'team': 'new'}}})
+        )
+        assert get_api_url_from_flyrc('example') == 'https://new.example.com'
+        assert mock_load.call_count == 2
 
-def test_get_token_from_flyrc_file_not_exists():
+
+def test_get_token_from_flyrc_file_not_exists(flyrc_home, capsys):
     """Test when flyrc file doesn't exist."""
-    with patch('voyager.concourse.Path.exists', return_value=False):
-        token = get_token_from_flyrc('example')
-        assert token is None
+    (flyrc_home / '.flyrc').unlink()
+    token = get_token_from_flyrc('example')
+    assert token is None
+    assert capsys.readouterr().err == ''
 
 
-def test_get_token_from_flyrc_yaml_error():
+def test_get_token_from_flyrc_yaml_error(flyrc_home, capsys):
     """Test handling of YAML parsing errors."""
-    with patch('voyager.concourse.Path.home') as mock_home, patch(
-        'voyager.concourse.Path.exists', return_value=True
-    ), patch('builtins.open', mock_open(read_data='invalid: yaml: content:')), patch(
-        'yaml.safe_load', side_effect=yaml.YAMLError('YAML error')
-    ), patch('click.echo') as mock_echo:
-        mock_home.return_value = Path('/mock/home')
-
-        token = get_token_from_flyrc('example')
-        assert token is None
-        mock_echo.assert_called_once()
-        assert 'Error reading flyrc file' in mock_echo.call_args[0][0]
+    (flyrc_home / '.flyrc').write_text('invalid: yaml: content:')
+    token = get_token_from_flyrc('example')
+    assert token is None
+    assert 'Error reading flyrc file' in capsys.readouterr().err
 
 
 def test_concourse_client_with_target():
     """Test ConcourseClient initialization using flyrc target."""
     # Create a test environment without CONCOURSE_TOKEN
+    flyrc_data = {
+        'api_url': 'https://concourse.flyrc.com',
+        'team': 'main-team',
+        'token': 'flyrc-token',
+    }
     with patch.dict(os.environ, {}, clear=True), patch(
-        'voyager.concourse.get_api_url_from_flyrc', return_value='https://concourse.flyrc.com'
-    ), patch('voyager.concourse.get_team_from_flyrc', return_value='main-team'), patch(
-        'voyager.concourse.get_token_from_flyrc', return_value='flyrc-token'
-    ):
+        'voyager.concourse.get_concourse_data_from_flyrc', return_value=flyrc_data
+    ) as mock_flyrc:
         client = ConcourseClient(target='example')
 
+        # The flyrc target should only be resolved once
+        mock_flyrc.assert_called_once_with('example')
+
         # Verify the client is using the values from flyrc
         assert client.api_url == 'https://concourse.flyrc.com'
         assert client.team == 'main-team'
@@ -237,11 +238,14 @@ def test_concourse_client_explicit_params():
 
 def test_concourse_client_parameter_priority():
     """Test ConcourseClient parameter priority (explicit > target)."""
+    flyrc_data = {
+        'api_url': 'https://concourse.flyrc.com',
+        'team': 'flyrc-team',
+        'token': 'flyrc-token',
+    }
     with patch.dict(os.environ, {}, clear=True), patch(
-        'voyager.concourse.get_api_url_from_flyrc', return_value='https://concourse.flyrc.com'
-    ), patch('voyager.concourse.get_team_from_flyrc', return_value='flyrc-team'), patch(
-        'voyager.concourse.get_token_from_flyrc', return_value='flyrc-token'
-    ):
+        'voyager.concourse.get_concourse_data_from_flyrc', return_value=flyrc_data
+    ) as mock_flyrc:
         # Explicit parameters should take priority over target values
         client = ConcourseClient(
             api_url='https://concourse.explicit.com',
@@ -254,13 +258,20 @@ def test_concourse_client_parameter_priority():
         assert client.team == 'explicit-team'
         assert client.token == 'explicit-token'
 
+        # Nothing was missing, so flyrc isn't consulted at all
+        mock_flyrc.assert_not_called()
+
+        # Missing values still come from the target
+        client = ConcourseClient(team='explicit-team', token='explicit-token', target='example')
+        assert client.api_url == 'https://concourse.flyrc.com'
+        assert client.team == 'explicit-team'
+        mock_flyrc.assert_called_once_with('example')
+
 
 def test_concourse_client_no_url():
     """Test ConcourseClient with no URL available."""
     with patch.dict(os.environ, {}, clear=True), patch(
-        'voyager.concourse.get_api_url_from_flyrc', return_value=None
-    ), patch('voyager.concourse.get_team_from_flyrc', return_value='team'), patch(
-        'voyager.concourse.get_token_from_flyrc', return_value='token'
+        'voyager.concourse.get_concourse_data_from_flyrc', return_value=None
     ):
         # Should raise ValueError when no URL is available
         with pytest.raises(ValueError) as excinfo:
@@ -275,7 +286,8 @@ def test_concourse_client_env_token_priority():
     """Test ConcourseClient token priority with environment variable."""
     # Test with environment variable token available
     with patch.dict(os.environ, {'CONCOURSE_TOKEN': 'env-token'}, clear=True), patch(
-        'voyager.concourse.get_token_from_flyrc', return_value='flyrc-token'
+        'voyager.concourse.get_concourse_data_from_flyrc',
+        return_value={'api_url': None, 'team': None, 'token': 'flyrc-token'},
     ):
         # Explicit token should take priority over env var and flyrc
         client = ConcourseClient(
@@ -287,14 +299,18 @@ def test_concourse_client_env_token_priority():
         client = ConcourseClient(api_url='https://concourse.example.com', team='main')
         assert client.token == 'env-token'
 
+        client = ConcourseClient(
+            api_url='https://concourse.example.com', team='main', target='example'
+        )
+        assert client.token == 'env-token'
+
 
 def test_concourse_client_no_token():
     """Test ConcourseClient with no token available."""
+    flyrc_data = {'api_url': 'https://concourse.example.com', 'team': 'main', 'token': None}
     with patch.dict(os.environ, {}, clear=True), patch(
-        'voyager.concourse.get_token_from_flyrc', return_value=None
-    ), patch(
-        'voyager.concourse.get_api_url_from_flyrc', return_value='https://concourse.example.com'
-    ), patch('voyager.concourse.get_team_from_flyrc', return_value='main'):
+        'voyager.concourse.get_concourse_data_from_flyrc', return_value=flyrc_data
+    ):
         # Should raise ValueError when no token is available
         with pytest.raises(ValueError) as excinfo:
             ConcourseClient(target='example')
@@ -306,11 +322,10 @@ def test_concourse_client_no_token():
 
 def test_concourse_client_no_team():
     """Test ConcourseClient with no team available."""
+    flyrc_data = {'api_url': 'https://concourse.example.com', 'team': None, 'token': 'token'}
     with patch.dict(os.environ, {}, clear=True), patch(
-        'voyager.concourse.get_token_from_flyrc', return_value='token'
-    ), patch(
-        'voyager.concourse.get_api_url_from_flyrc', return_value='https://concourse.example.com'
-    ), patch('voyager.concourse.get_team_from_flyrc', return_value=None):
+        'voyager.concourse.get_concourse_data_from_flyrc', return_value=flyrc_data
+    ):
         # Should raise ValueError when no team is available
         with pytest.raises(ValueError) as excinfo:
             ConcourseClient(target='example')
@@ -318,3 +333,281 @@ def test_concourse_client_no_team():
         # Check error message
         assert 'Concourse team not found' in str(excinfo.value)
         assert 'flyrc' in str(excinfo.value)
+
+
+def test_concourse_client_get_reuses_instances():
+    """Test that ConcourseClient.get returns one client per complete set of settings."""
+    flyrc_data = {'api_url': 'https://concourse.flyrc.com', 'team': 'main', 'token': 'flyrc-token'}
+    with patch.dict(os.environ, {}, clear=True), patch(
+        'voyager.concourse.get_concourse_data_from_flyrc', return_value=flyrc_data
+    ), patch.dict(ConcourseClient._instances, clear=True):
+        client = ConcourseClient.get(target='example')
+        assert ConcourseClient.get(target='example') is client
+
+        # Explicit settings matching the target resolve to the same client
+        assert (
+            ConcourseClient.get(
+                api_url='https://concourse.flyrc.com', team='main', token='flyrc-token'
+            )
+            is client
+        )
+
+        # Any other token, timeout, backoff or retry count gets a client of its own
+        others = [
+            ConcourseClient.get(target='example', token='other-token'),
+            ConcourseClient.get(target='example', read_timeout=120.0),
+            ConcourseClient.get(target='example', poll_backoff_max=5.0),
+            ConcourseClient.get(target='example', max_retries=0),
+        ]
+        assert len({id(other) for other in [client, *others]}) == 5
+        assert others[0].token == 'other-token'
+        assert others[1].timeout == (CONNECT_TIMEOUT, 120.0)
+
+        # The environment's backoff is part of the key too
+        with patch.dict(os.environ, {'CONCOURSE_POLL_MIN': '1'}):
+            assert ConcourseClient.get(target='example') is not client
+
+
+def test_get_flyrc_data_rejects_multiple_documents(flyrc_home, capsys):
+    """Test that a flyrc file with more than one YAML document is treated as unreadable."""
+    (flyrc_home / '.flyrc').write_text('targets: {}\n---\ntargets: {}\n')
+    assert get_flyrc_data() is None
+    assert 'Error reading flyrc file' in capsys.readouterr().err
+
+
+def test_concourse_client_has_no_instance_dict():
+    """Test that ConcourseClient instances only carry their declared slots."""
+    client = ConcourseClient(api_url='https://concourse.example.com', team='main', token='token')
+    assert not hasattr(client, '__dict__')
+    with pytest.raises(AttributeError):
+        client.extra = 'value'
+
+
+@pytest.fixture
+def client():
+    """Concourse client with explicit connection settings."""
+    with ConcourseClient(
+        api_url='https://concourse.example.com', team='main', token='token'
+    ) as client:
+        yield client
+
+
+def make_response(status_code=200, json_data=None, headers=None):
+    """Create a mock HTTP response."""
+    return MagicMock(
+        status_code=status_code,
+        content=json.dumps(json_data).encode(),
+        text='',
+        headers=headers or {},
+    )
+
+
+def test_concourse_client_session_carries_headers(client):
+    """Test that the pooled session is set up with the client headers."""
+    assert client.session.headers['Authorization'] == 'Bearer token'
+    assert client.session.headers['Content-Type'] == 'application/json'
+
+
+def test_trigger_pipeline_posts_through_session(client, capsys):
+    """Test triggering a job posts its variables through the shared session."""
+    with patch.object(
+        client.session, 'request', return_value=make_response(201, {'id': 42, 'name': '7'})
+    ) as mock_request:
+        assert client.trigger_pipeline('release', 'build', {'version': '1.0.0'})
+
+    mock_request.assert_called_once_with(
+        'POST',
+        'https://concourse.example.com/api/v1/teams/main/pipelines/release/jobs/build/builds',
+        json={'vars': {'version': '1.0.0'}},
+        timeout=(CONNECT_TIMEOUT, READ_TIMEOUT),
+    )
+    assert capsys.readouterr().out == (
+        'Pipeline triggered: Build #42\n'
+        'URL: https://concourse.example.com/teams/main/pipelines/release/jobs/build/builds/7\n'
+    )
+
+
+def test_get_pipeline_builds_through_session(client):
+    """Test recent builds are fetched through the shared session."""
+    builds = [{'id': 1, 'status': 'succeeded'}]
+    with patch.object(
+        client.session, 'request', return_value=make_response(200, builds)
+    ) as mock_request:
+        assert client.get_pipeline_builds('release', limit=3) == builds
+
+    mock_request.assert_called_once_with(
+        'GET',
+        'https://concourse.example.com/api/v1/teams/main/pipelines/release/builds',
+        params={'limit': 3},
+        timeout=(CONNECT_TIMEOUT, READ_TIMEOUT),
+    )
+
+
+def test_request_honors_retry_after(client):
+    """Test a refused request is resent after the server's Retry-After delay."""
+    responses = [make_response(429, headers={'Retry-After': '2'}), make_response(201, {'id': 1})]
+    with patch.object(client.session, 'request', side_effect=responses) as mock_request, patch(
+        'voyager.concourse.time.sleep'
+    ) as mock_sleep:
+        assert client.trigger_pipeline('release', 'build')
+
+    assert mock_request.call_count == 2
+    mock_sleep.assert_called_once_with(2.0)
+
+
+@pytest.mark.parametrize(
+    'retry_after, expected',
+    [
+        pytest.param('Thu, 01 Jan 1970 00:17:00 GMT', 20.0, id='http-date'),
+        pytest.param('-1', 0.0, id='negative'),
+        pytest.param('nan', RETRY_BACKOFF_MIN, id='nan'),
+        pytest.param('soon', RETRY_BACKOFF_MIN, id='unparsable'),
+    ],
+)
+def test_request_parses_and_clamps_retry_after(client, retry_after, expected):
+    """Test Retry-After dates are honored and bad values fall back or are clamped."""
+    responses = [
+        make_response(429, headers={'Retry-After': retry_after}),
+        make_response(201, {'id': 1}),
+    ]
+    with patch.object(client.session, 'request', side_effect=responses), patch(
+        'voyager.utils.time.time', return_value=1000
+    ), patch('voyager.concourse.time.sleep') as mock_sleep:
+        assert client.trigger_pipeline('release', 'build')
+
+    mock_sleep.assert_called_once_with(expected)
+
+
+def test_request_backs_off_exponentially(client):
+    """Test transient GET failures are retried with a doubling delay, then given up on."""
+    with patch.object(
+        client.session, 'request', return_value=make_response(502)
+    ) as mock_request, patch('voyager.concourse.time.sleep') as mock_sleep:
+        assert client.get_pipeline_builds('release') == []
+
+    assert mock_request.call_count == MAX_RETRIES + 1
+    assert [c.args[0] for c in mock_sleep.call_args_list] == [0.05, 0.1, 0.2]
+
+
+def test_request_does_not_resend_failed_post(client):
+    """Test a POST that may have been processed is not retried."""
+    with patch.object(
+        client.session, 'request', return_value=make_response(502)
+    ) as mock_request, patch('voyager.concourse.time.sleep') as mock_sleep:
+        assert not client.trigger_pipeline('release', 'build')
+
+    mock_request.assert_called_once()
+    mock_sleep.assert_not_called()
+
+
+def test_get_pipeline_builds_many(client):
+    """Test builds for several pipelines are fetched and keyed by pipeline name."""
+    builds = {name: [{'id': i, 'pipeline_name': name}] for i, name in enumerate(PIPELINES)}
+
+    def get_builds(pipeline_name, limit):
+        assert limit == 2
+        return builds[pipeline_name]
+
+    with patch.object(ConcourseClient, 'get_pipeline_builds', side_effect=get_builds) as mock_get:
+        assert client.get_pipeline_builds_many(PIPELINES, limit=2) == builds
+
+    assert mock_get.call_count == len(PIPELINES)
+
+
+def test_request_timeout_can_be_raised():
+    """Test a client built with a longer read timeout passes it on, and timeouts propagate."""
+    with ConcourseClient(
+        api_url='https://concourse.example.com', team='main', token='token', read_timeout=120
+    ) as client, patch.object(
+        client.session, 'request', side_effect=requests.exceptions.Timeout('read timed out')
+    ) as mock_request:
+        with pytest.raises(requests.exceptions.Timeout):
+            client.trigger_pipeline('release', 'build')
+
+    assert mock_request.call_args.kwargs['timeout'] == (CONNECT_TIMEOUT, 120)
+
+
+def test_request_backoff_is_configurable():
+    """Test explicit backoff settings win over the environment and cap every wait."""
+    responses = [make_response(429, headers={'Retry-After': '600'}), make_response(502)]
+    env = {'CONCOURSE_POLL_MIN': '0.5', 'CONCOURSE_POLL_MAX': '10'}
+    with patch.dict(os.environ, env), ConcourseClient(
+        api_url='https://concourse.example.com',
+        team='main',
+        token='token',
+        poll_backoff_max=5.0,
+        max_retries=1,
+    ) as client, patch.object(client.session, 'request', side_effect=responses * 2), patch(
+        'voyager.concourse.time.sleep'
+    ) as mock_sleep:
+        # The minimum comes from the environment, the maximum from the argument
+        assert (client.backoff_min, client.backoff_max) == (0.5, 5.0)
+
+        # A long Retry-After is cut to the maximum, then the single retry is used up
+        assert not client.trigger_pipeline('release', 'build')
+
+    mock_sleep.assert_called_once_with(5.0)
+
+
+@pytest.mark.parametrize(
+    'env, kwargs, message',
+    [
+        pytest.param(
+            {'CONCOURSE_POLL_MIN': 'fast'},
+            {},
+            "CONCOURSE_POLL_MIN must be a number of seconds, got 'fast'",
+            id='env-min-text',
+        ),
+        pytest.param(
+            {'CONCOURSE_POLL_MAX': ''},
+            {},
+            "CONCOURSE_POLL_MAX must be a number of seconds, got ''",
+            id='env-max-empty',
+        ),
+        pytest.param(
+            {'CONCOURSE_POLL_MIN': 'nan'}, {}, 'CONCOURSE_POLL_MIN must be a number', id='env-nan'
+        ),
+        pytest.param(
+            {'CONCOURSE_POLL_MIN': '20', 'CONCOURSE_POLL_MAX': '10'},
+            {},
+            r'CONCOURSE_POLL_MIN \(20s\) must not be greater than CONCOURSE_POLL_MAX \(10s\)',
+            id='env-min-above-max',
+        ),
+        pytest.param(
+            {'CONCOURSE_POLL_MIN': '20'},
+            {'poll_backoff_max': 5.0},
+            r'CONCOURSE_POLL_MIN \(20s\) must not be greater than poll_backoff_max \(5s\)',
+            id='env-min-above-arg-max',
+        ),
+        pytest.param(
+            {},
+            {'poll_backoff_min': 2.0, 'poll_backoff_max': 1.0},
+            r'poll_backoff_min \(2s\) must not be greater than poll_backoff_max \(1s\)',
+            id='arg-min-above-max',
+        ),
+    ],
+)
+def test_backoff_settings_are_validated(env, kwargs, message):
+    """Test malformed or inverted backoff settings are rejected, naming the setting."""
+    with patch.dict(os.environ, env), pytest.raises(ValueError, match=message):
+        ConcourseClient(
+            api_url='https://concourse.example.com', team='main', token='token', **kwargs
+        )
+
+
+def test_negative_backoff_settings_are_clamped():
+    """Test negative backoff settings from the environment or arguments become zero."""
+    env = {'CONCOURSE_POLL_MIN': '-1', 'CONCOURSE_POLL_MAX': '-5'}
+    with patch.dict(os.environ, env), ConcourseClient(
+        api_url='https://concourse.example.com', team='main', token='token'
+    ) as client:
+        assert (client.backoff_min, client.backoff_max) == (0.0, 0.0)
+
+    with ConcourseClient(
+        api_url='https://concourse.example.com',
+        team='main',
+        token='token',
+        poll_backoff_min=-0.5,
+        poll_backoff_max=1.0,
+    ) as client:
+        assert (client.backoff_min, client.backoff_max) == (0.0, 1.0)
@@ -0,0 +1,102 @@
+import os
+import subprocess
+from unittest.mock import patch
+
+import pytest
+
+from voyager.git import GitHelper
+
+OLD_TAG = 'git_release_tag: release-v1.0.0'
+NEW_TAG = 'git_release_tag: release-v1.1.0'
+
+# File name patterns the release flow rewrites for a repository named 'app'
+PATTERNS = ('*-app.yml', '*.app.yaml')
+
+
+@pytest.fixture
+def params_dir(tmp_path):
+    """Params checkout with matching, non-matching and .git-internal files."""
+    (tmp_path / 'env').mkdir()
+    (tmp_path / 'env' / 'prod-app.yml').write_text(f'{OLD_TAG}\nother: value\n')
+    (tmp_path / 'staging.app.yaml').write_text(f'{OLD_TAG}\n')
+    (tmp_path / 'prod-other.yml').write_text(f'{OLD_TAG}\n')
+    (tmp_path / '.git').mkdir()
+    (tmp_path / '.git' / 'stale-app.yml').write_text(f'{OLD_TAG}\n')
+    return tmp_path
+
+
+def test_replace_in_files_rewrites_matching_files(params_dir):
+    """Test only files matching a pattern are rewritten, and .git is never entered."""
+    updated = GitHelper()._replace_in_files(str(params_dir), PATTERNS, OLD_TAG, NEW_TAG)
+
+    assert sorted(updated) == sorted(
+        [str(params_dir / 'env' / 'prod-app.yml'), str(params_dir / 'staging.app.yaml')]
+    )
+    assert (params_dir / 'env' / 'prod-app.yml').read_text() == f'{NEW_TAG}\nother: value\n'
+    assert (params_dir / 'staging.app.yaml').read_text() == f'{NEW_TAG}\n'
+    assert (params_dir / 'prod-other.yml').read_text() == f'{OLD_TAG}\n'
+    assert (params_dir / '.git' / 'stale-app.yml').read_text() == f'{OLD_TAG}\n'
+
+
+def test_replace_in_files_keeps_file_mode(params_dir):
+    """Test a rewritten file keeps its permission bits."""
+    path = params_dir / 'staging.app.yaml'
+    path.chmod(0o640)
+
+    GitHelper()._replace_in_files(str(params_dir), PATTERNS, OLD_TAG, NEW_TAG)
+
+    assert path.stat().st_mode & 0o777 == 0o640
+
+
+def test_replace_in_files_leaves_unmatched_content_alone(params_dir):
+    """Test a matching file without the old text is not rewritten at all."""
+    path = params_dir / 'staging.app.yaml'
+    path.write_text(f'{NEW_TAG}\n')
+    before = path.stat()
+
+    updated = GitHelper()._replace_in_files(str(params_dir), PATTERNS, OLD_TAG, NEW_TAG)
+
+    assert str(path) not in updated
+    after = path.stat()
+    assert (after.st_ino, after.st_mtime_ns) == (before.st_ino, before.st_mtime_ns)
+
+
+def test_replace_in_files_removes_temp_file_on_failure(params_dir):
+    """Test a failed swap leaves the original in place and no temporary file behind."""
+    before = sorted(os.listdir(params_dir))
+
+    with patch('voyager.git.os.replace', side_effect=OSError('disk full')):
+        with pytest.raises(OSError):
+            GitHelper()._replace_in_files(str(params_dir), ('*.app.yaml',), OLD_TAG, NEW_TAG)
+
+    assert sorted(os.listdir(params_dir)) == before
+    assert (params_dir / 'staging.app.yaml').read_text() == f'{OLD_TAG}\n'
+
+
+def test_update_git_release_tag_pulls_before_atomic_push():
+    """Test master is pulled before the rebase, and master and tag are pushed atomically."""
+    commands = []
+
+    def fake_run(cmd, **kwargs):
+        commands.append(cmd)
+        # The release tag lookups are the only shell pipelines; answer previous, then latest
+        tags = {'head -1': 'release-v1.0.0', 'tail -1': 'release-v1.1.0'}
+        stdout = next((tag for end, tag in tags.items() if str(cmd).endswith(end)), '')
+        return subprocess.CompletedProcess(cmd, 0, stdout=stdout)
+
+    with patch('voyager.git.subprocess.run', side_effect=fake_run), patch(
+        'voyager.git.os.path.exists', return_value=True
+    ), patch.object(GitHelper, '_replace_in_files'), patch('builtins.input', return_value='y'):
+        assert GitHelper().update_git_release_tag('owner', 'app')
+
+    release_tag = 'app-release-v1.1.0'
+    git_commands = [cmd[1:] for cmd in commands if isinstance(cmd, list)]
+    tail = git_commands[git_commands.index(['checkout', 'master']) :]
+    assert tail == [
+        ['checkout', 'master'],
+        ['pull', 'origin', 'master'],
+        ['rebase', release_tag],
+        ['branch', '-D', release_tag],
+        ['tag', '-a', release_tag, '-m', f'Version {release_tag}'],
+        ['push', '--atomic', 'origin', 'master', f'refs/tags/{release_tag}'],
+    ]
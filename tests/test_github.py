@@ -0,0 +1,460 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from voyager.github import (
+    DEFAULT_RETRY_AFTER,
+    MAX_RATE_LIMIT_WAIT,
+    REQUEST_TIMEOUT,
+    GitHubClient,
+)
+
+
+def make_response(status_code=200, json_data=None, headers=None, links=None):
+    """Create a mock HTTP response."""
+    response = MagicMock()
+    response.status_code = status_code
+    response.content = json.dumps(json_data).encode()
+    response.headers = headers or {}
+    response.links = links or {}
+    response.text = ''
+    return response
+
+
+@pytest.fixture
+def stub_server():
+    """Local HTTP server answering every request from a list of (status, headers) replies.
+
+    The last reply repeats once the list is used up; the paths requested are recorded.
+    """
+
+    class Handler(BaseHTTPRequestHandler):
+        def _reply(self):
+            server.hits.append(self.path)
+            status, headers = server.replies[min(len(server.hits), len(server.replies)) - 1]
+            self.send_response(status)
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.send_header('Content-Length', '2')
+            self.end_headers()
+            self.wfile.write(b'[]')
+
+        do_GET = do_DELETE = _reply
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    server.hits = []
+    server.replies = [(200, {})]
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def stub_client(stub_server):
+    """GitHub client talking to the stub server through the real retrying adapter."""
+    api_url = f'http://127.0.0.1:{stub_server.server_port}'
+    with GitHubClient(api_url=api_url, token='test-token') as client:
+        # Keep the adapter's retries but skip their backoff sleeps
+        client.session.get_adapter(api_url).max_retries.backoff_factor = 0
+        yield client
+
+
+@pytest.fixture
+def client():
+    """GitHub client with a token set."""
+    with GitHubClient(api_url='https://api.github.example.com', token='test-token') as client:
+        yield client
+
+
+def test_session_carries_auth_headers(client):
+    """Test that the pooled session is set up with the client headers."""
+    assert client.session.headers['Authorization'] == 'token test-token'
+    assert client.session.headers['Accept'] == 'application/vnd.github.v3+json'
+    assert client.session.verify is False
+
+
+def test_requests_reuse_session(client):
+    """Test that API calls go through the shared session."""
+    with patch.object(
+        client.session, 'request', return_value=make_response(json_data={'tag_name': 'v1.0.0'})
+    ) as mock_request:
+        release = client.get_latest_release('owner', 'repo')
+
+    assert release == {'tag_name': 'v1.0.0'}
+    mock_request.assert_called_once_with(
+        'GET',
+        'https://api.github.example.com/repos/owner/repo/releases/latest',
+        params=None,
+        headers={},
+        timeout=REQUEST_TIMEOUT,
+    )
+
+
+def test_context_manager_closes_session():
+    """Test that leaving the context closes the session."""
+    client = GitHubClient(token='test-token')
+    with patch.object(client.session, 'close') as mock_close:
+        with client:
+            pass
+
+    mock_close.assert_called_once()
+
+
+def test_get_releases_many_preserves_order(client):
+    """Test that bulk release lookups return results in input order."""
+    releases = {
+        'https://api.github.example.com/repos/owner/one/releases': [{'tag_name': 'v1.0.0'}],
+        'https://api.github.example.com/repos/owner/two/releases': [{'tag_name': 'v2.0.0'}],
+        'https://api.github.example.com/repos/owner/three/releases': [],
+    }
+
+    def fake_request(method, url, **kwargs):
+        return make_response(json_data=releases[url])
+
+    with patch.object(client.session, 'request', side_effect=fake_request):
+        result = client.get_releases_many([('owner', 'one'), ('owner', 'two'), ('owner', 'three')])
+
+    assert result == [[{'tag_name': 'v1.0.0'}], [{'tag_name': 'v2.0.0'}], []]
+
+
+def test_etag_revalidation_returns_cached_body(client):
+    """Test that a 304 response reuses the body cached with its ETag."""
+    responses = [
+        make_response(json_data=[{'tag_name': 'v1.0.0'}], headers={'ETag': '"abc"'}),
+        make_response(status_code=304),
+    ]
+    with patch.object(client.session, 'request', side_effect=responses) as mock_request:
+        first = client.get_releases('owner', 'repo')
+        client.invalidate('owner', 'repo')
+        second = client.get_releases('owner', 'repo')
+
+    assert first == second == [{'tag_name': 'v1.0.0'}]
+    assert 'If-None-Match' not in mock_request.call_args_list[0].kwargs['headers']
+    assert mock_request.call_args_list[1].kwargs['headers'] == {'If-None-Match': '"abc"'}
+
+
+def test_failed_get_raises(client):
+    """Test that non-200 responses raise with the status code."""
+    with patch.object(client.session, 'request', return_value=make_response(status_code=404)):
+        with pytest.raises(Exception, match='Failed to get releases: 404'):
+            client.get_releases('owner', 'repo')
+
+
+@pytest.mark.parametrize('per_page, expected', [(None, 100), (20, 20), (0, 1), (500, 100)])
+def test_get_releases_per_page(client, per_page, expected):
+    """Test that per_page defaults to 100 and is clamped to GitHub's limits."""
+    kwargs = {} if per_page is None else {'per_page': per_page}
+    with patch.object(
+        client.session, 'request', return_value=make_response(json_data=[])
+    ) as mock_request:
+        client.get_releases('owner', 'repo', **kwargs)
+
+    assert mock_request.call_args.kwargs['params'] == {'per_page': expected}
+
+
+def test_list_all_releases_fetches_every_page(client):
+    """Test that all pages up to the Link: last page are fetched and concatenated."""
+    url = 'https://api.github.example.com/repos/owner/repo/releases'
+    links = {'last': {'url': f'{url}?per_page=100&page=3'}}
+
+    def fake_request(method, url, params=None, **kwargs):
+        page = params['page']
+        return make_response(json_data=[{'tag_name': f'v{page}.0.0'}], links=links)
+
+    with patch.object(client.session, 'request', side_effect=fake_request) as mock_request:
+        releases = client.list_all_releases('owner', 'repo')
+
+    assert [r['tag_name'] for r in releases] == ['v1.0.0', 'v2.0.0', 'v3.0.0']
+    assert mock_request.call_count == 3
+
+
+def test_list_all_releases_single_page(client):
+    """Test that no further requests are made without a Link: last header."""
+    with patch.object(
+        client.session, 'request', return_value=make_response(json_data=[{'tag_name': 'v1.0.0'}])
+    ) as mock_request:
+        releases = client.list_all_releases('owner', 'repo')
+
+    assert releases == [{'tag_name': 'v1.0.0'}]
+    mock_request.assert_called_once()
+
+
+def test_release_lookups_are_memoized(client):
+    """Test that repeated lookups within the TTL don't hit the API again."""
+    with patch.object(
+        client.session, 'request', return_value=make_response(json_data={'tag_name': 'v1.0.0'})
+    ) as mock_request:
+        client.get_latest_release('owner', 'repo')
+        client.get_latest_release('owner', 'repo')
+
+    mock_request.assert_called_once()
+
+
+def test_create_release_invalidates_cache(client):
+    """Test that creating a release drops cached lookups for that repository."""
+    responses = {
+        'GET': make_response(json_data={'tag_name': 'v1.0.0'}),
+        'POST': make_response(201, {'tag_name': 'v1.1.0'}),
+    }
+
+    def fake_request(method, url, **kwargs):
+        return responses[method]
+
+    with patch.object(client.session, 'request', side_effect=fake_request) as mock_request:
+        client.get_latest_release('owner', 'repo')
+        client.create_release('owner', 'repo', 'v1.1.0', 'Release v1.1.0', 'body')
+        client.get_latest_release('owner', 'repo')
+
+    methods = [call.args[0] for call in mock_request.call_args_list]
+    assert methods == ['GET', 'POST', 'GET']
+
+
+def test_loads_without_orjson(client):
+    """Test that JSON bodies decode with the standard library when orjson is missing."""
+    with patch('voyager.utils.orjson', None), patch.object(
+        client.session, 'request', return_value=make_response(json_data=[{'tag_name': 'v1.0.0'}])
+    ):
+        assert client.get_releases('owner', 'repo') == [{'tag_name': 'v1.0.0'}]
+
+
+def test_retry_after_is_honored(client):
+    """Test that a rate-limited response is retried once after Retry-After."""
+    responses = [
+        make_response(status_code=403, headers={'Retry-After': '2'}),
+        make_response(json_data=[]),
+    ]
+    with patch.object(client.session, 'request', side_effect=responses) as mock_request, patch(
+        'voyager.github.time.sleep'
+    ) as mock_sleep:
+        assert client.get_releases('owner', 'repo') == []
+
+    mock_sleep.assert_called_once_with(2.0)
+    assert mock_request.call_count == 2
+
+
+def test_exhausted_quota_waits_for_reset(client):
+    """Test a refused request waits until the reset time and is sent again."""
+    headers = {'X-RateLimit-Remaining': '0', 'X-RateLimit-Reset': '1030'}
+    responses = [make_response(status_code=403, headers=headers), make_response(json_data=[])]
+    with patch.object(client.session, 'request', side_effect=responses) as mock_request, patch(
+        'voyager.github.time.time', return_value=1000
+    ), patch('voyager.github.time.sleep') as mock_sleep:
+        assert client.get_releases('owner', 'repo') == []
+
+    mock_sleep.assert_called_once_with(30)
+    assert mock_request.call_count == 2
+
+
+def test_exhausted_quota_delays_next_request(client):
+    """Test a successful response that uses up the quota is kept, and the next call waits."""
+    headers = {'X-RateLimit-Remaining': '0', 'X-RateLimit-Reset': '1030'}
+    responses = [
+        make_response(201, {'tag_name': 'v1.1.0'}, headers=headers),
+        make_response(json_data=[]),
+    ]
+    with patch.object(client.session, 'request', side_effect=responses), patch(
+        'voyager.github.time.time', return_value=1000
+    ), patch('voyager.github.time.sleep') as mock_sleep:
+        release = client.create_release('owner', 'repo', 'v1.1.0', 'Release v1.1.0', 'body')
+        assert release == {'tag_name': 'v1.1.0'}
+        mock_sleep.assert_not_called()
+
+        assert client.get_releases('owner', 'repo') == []
+
+    mock_sleep.assert_called_once_with(30)
+
+
+def test_retry_after_accepts_http_date(client):
+    """Test a Retry-After given as an HTTP date is waited out until that time."""
+    headers = {'Retry-After': 'Thu, 01 Jan 1970 00:17:00 GMT'}
+    responses = [make_response(status_code=429, headers=headers), make_response(json_data=[])]
+    with patch.object(client.session, 'request', side_effect=responses), patch(
+        'voyager.utils.time.time', return_value=1000
+    ), patch('voyager.github.time.sleep') as mock_sleep:
+        assert client.get_releases('owner', 'repo') == []
+
+    mock_sleep.assert_called_once_with(20.0)
+
+
+@pytest.mark.parametrize(
+    'retry_after, expected',
+    [('not a date', DEFAULT_RETRY_AFTER), ('86400', MAX_RATE_LIMIT_WAIT)],
+)
+def test_retry_after_falls_back_and_is_capped(client, retry_after, expected):
+    """Test an unparsable Retry-After waits the default, and a long one is capped."""
+    responses = [
+        make_response(status_code=429, headers={'Retry-After': retry_after}),
+        make_response(json_data=[]),
+    ]
+    with patch.object(client.session, 'request', side_effect=responses), patch(
+        'voyager.github.time.sleep'
+    ) as mock_sleep:
+        client.get_releases('owner', 'repo')
+
+    mock_sleep.assert_called_once_with(expected)
+
+
+@pytest.mark.parametrize('reset', ['4600', 'soon'])
+def test_distant_or_invalid_reset_raises(client, reset):
+    """Test a request refused until a distant or unknown reset fails fast instead of sleeping."""
+    headers = {'X-RateLimit-Remaining': '0', 'X-RateLimit-Reset': reset}
+    with patch.object(
+        client.session, 'request', return_value=make_response(403, headers=headers)
+    ) as mock_request, patch('voyager.github.time.time', return_value=1000), patch(
+        'voyager.github.time.sleep'
+    ) as mock_sleep:
+        with pytest.raises(Exception, match='rate limit exhausted'):
+            client.get_releases('owner', 'repo')
+
+    mock_request.assert_called_once()
+    mock_sleep.assert_not_called()
+
+
+@pytest.mark.parametrize('reset', ['4600', 'soon'])
+def test_distant_reset_keeps_successful_response(client, reset):
+    """Test a request that went through is returned even if the quota resets far off."""
+    headers = {'X-RateLimit-Remaining': '0', 'X-RateLimit-Reset': reset}
+
+    def fake_request(method, url, **kwargs):
+        return make_response(status_code=204, headers=headers)
+
+    with patch.object(client.session, 'request', side_effect=fake_request) as mock_request, patch(
+        'voyager.github.time.time', return_value=1000
+    ), patch('voyager.github.time.sleep') as mock_sleep:
+        assert client.delete_release('owner', 'repo', 1)
+
+        # Only the following request is refused, before it is sent
+        with pytest.raises(Exception, match='rate limit exhausted'):
+            client.delete_release('owner', 'repo', 2)
+
+    mock_request.assert_called_once()
+    mock_sleep.assert_not_called()
+
+
+def test_delete_many_reports_each_release(client):
+    """Test that bulk deletion returns the outcome per release ID."""
+
+    def fake_request(method, url, **kwargs):
+        return make_response(status_code=404 if url.endswith('/2') else 204)
+
+    with patch.object(client.session, 'request', side_effect=fake_request) as mock_request:
+        results = client.delete_many('owner', 'repo', [1, 2, 3])
+
+    assert results == {1: True, 2: False, 3: True}
+    assert {call.args[0] for call in mock_request.call_args_list} == {'DELETE'}
+
+
+def test_delete_many_survives_failures_and_concurrent_invalidation(client):
+    """Test a raising delete is reported as False while other workers keep invalidating."""
+
+    def fake_request(method, url, **kwargs):
+        if url.endswith('/3'):
+            raise ConnectionError('connection reset')
+        # Keep the release cache churning while other workers invalidate it
+        for page in range(200):
+            client._release_cache[('releases', 'owner', 'repo', page)] = (0.0, [])
+        return make_response(status_code=204)
+
+    class ChurningKey(tuple):
+        """Cache key that adds an entry whenever invalidate() inspects it."""
+
+        def __getitem__(self, index):
+            client._release_cache[('releases', 'owner', 'repo', 'churn')] = (0.0, [])
+            return super().__getitem__(index)
+
+    # Another repository's entry, so every invalidation also sees the cache grow mid-scan
+    client._release_cache[ChurningKey(('releases', 'other', 'repo', 1))] = (0.0, [])
+
+    release_ids = list(range(1, 33))
+    with patch.object(client.session, 'request', side_effect=fake_request):
+        results = client.delete_many('owner', 'repo', release_ids)
+
+    assert results == {release_id: release_id != 3 for release_id in release_ids}
+
+
+def test_iter_release_ids_follows_next_links(client):
+    """Test that release IDs are yielded page by page until there is no next link."""
+    next_url = 'https://api.github.example.com/repos/owner/repo/releases?per_page=100&page=2'
+    responses = [
+        make_response(json_data=[{'id': 1}, {'id': 2}], links={'next': {'url': next_url}}),
+        make_response(json_data=[{'id': 3}]),
+    ]
+    with patch.object(client.session, 'request', side_effect=responses) as mock_request:
+        release_ids = client.iter_release_ids('owner', 'repo')
+        assert next(release_ids) == 1
+        assert mock_request.call_count == 1
+        assert list(release_ids) == [2, 3]
+
+    assert mock_request.call_args.args[1] == next_url
+
+
+def test_insecure_warnings_disabled_once():
+    """Test that urllib3 warnings are only silenced on the first unverified client."""
+    with patch.object(GitHubClient, '_warnings_disabled', False), patch(
+        'voyager.github.urllib3.disable_warnings'
+    ) as mock_disable:
+        GitHubClient(token='test-token')
+        GitHubClient(token='test-token')
+
+    mock_disable.assert_called_once()
+
+
+def test_latest_releases_graphql_batches_repositories(client):
+    """Test that one GraphQL request returns the latest release of each repository."""
+    data = {
+        'r0': {'latestRelease': {'tagName': 'v1.0.0', 'name': 'One', 'description': 'notes'}},
+        'r1': {'latestRelease': None},
+    }
+    with patch.object(
+        client.session, 'request', return_value=make_response(json_data={'data': data})
+    ) as mock_request:
+        releases = client.get_latest_releases_graphql([('owner', 'one'), ('owner', 'two')])
+
+    assert releases == [{'tag_name': 'v1.0.0', 'name': 'One', 'body': 'notes'}, None]
+    mock_request.assert_called_once()
+    method, url = mock_request.call_args.args
+    assert (method, url) == ('POST', 'https://api.github.example.com/graphql')
+    assert mock_request.call_args.kwargs['json']['variables'] == {
+        'o0': 'owner',
+        'n0': 'one',
+        'o1': 'owner',
+        'n1': 'two',
+    }
+
+
+def test_graphql_url_for_enterprise():
+    """Test that GitHub Enterprise GraphQL requests go to /api/graphql."""
+    client = GitHubClient(api_url='https://github.example.com/api/v3', token='test-token')
+    assert client._graphql_url == 'https://github.example.com/api/graphql'
+
+
+def test_adapter_returns_last_server_error(stub_server, stub_client):
+    """Test exhausted server-error retries hand back the response instead of raising."""
+    stub_server.replies = [(503, {})]
+
+    assert stub_client.delete_release('owner', 'repo', 1) is False
+    assert len(stub_server.hits) == 4
+
+    stub_server.hits.clear()
+    with pytest.raises(Exception, match='Failed to get releases: 503'):
+        stub_client.get_releases('owner', 'repo')
+    assert len(stub_server.hits) == 4
+
+
+def test_rate_limit_reaches_request_helper(stub_server, stub_client):
+    """Test a 429 is not retried by the adapter, so _request can honor its Retry-After."""
+    stub_server.replies = [(429, {'Retry-After': '1'}), (200, {})]
+
+    with patch('voyager.github.time.sleep') as mock_sleep:
+        assert stub_client.get_releases('owner', 'repo') == []
+
+    mock_sleep.assert_called_once_with(1.0)
+    assert len(stub_server.hits) == 2
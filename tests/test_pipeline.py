@@ -3,273 +3,317 @@
 # Standard library imports
 import os
 import subprocess
-import unittest
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import DEFAULT, MagicMock, patch
+
+# Third-party imports
+import pytest
 
 # Local application imports
 from voyager.pipeline import PipelineRunner
 
+# Every test here only touches mocks
+pytestmark = pytest.mark.parallel
 
-class TestPipelineRunner(unittest.TestCase):
-    """Test cases for the PipelineRunner class."""
-
-    def setUp(self):
-        """Set up test fixtures before each test method."""
-        self.foundation = 'test-foundation'
-        self.repo = 'test-repo'
-        self.pipeline = 'test-pipeline'
+# Result of a successful subprocess.run; failures raise CalledProcessError instead
+OK_PROCESS = SimpleNamespace(returncode=0)
 
-        # Mock file system operations
-        patcher = patch('os.path.exists')
-        self.mock_exists = patcher.start()
-        self.addCleanup(patcher.stop)
 
-        patcher = patch('os.listdir')
-        self.mock_listdir = patcher.start()
-        self.addCleanup(patcher.stop)
+def make_dir_entry(name, is_file=True):
+    """Create a mock os.DirEntry for a file in the CI directory."""
+    entry = MagicMock()
+    entry.name = name
+    entry.path = os.path.join('/ci', name)
+    entry.is_file.return_value = is_file
+    return entry
 
-        patcher = patch('os.path.isfile')
-        self.mock_isfile = patcher.start()
-        self.addCleanup(patcher.stop)
 
-        patcher = patch('os.access')
-        self.mock_access = patcher.start()
-        self.addCleanup(patcher.stop)
-
-        # Set up default mock behavior
-        self.mock_exists.side_effect = lambda path: path == os.path.expanduser(
-            f'~/git/{self.repo}/ci'
-        )
-        self.mock_listdir.return_value = ['fly.sh']
-        self.mock_isfile.return_value = True
-        self.mock_access.return_value = True
+class TestPipelineRunner:
+    """Test cases for the PipelineRunner class."""
 
-        self.expected_ci_dir = os.path.expanduser(f'~/git/{self.repo}/ci')
-        self.pipeline_runner = PipelineRunner(self.foundation, self.repo, self.pipeline)
+    foundation = 'test-foundation'
+    repo = 'test-repo'
+    pipeline = 'test-pipeline'
+    expected_ci_dir = os.path.expanduser(f'~/git/{repo}/ci')
+
+    @pytest.fixture(autouse=True)
+    def mock_os(self):
+        """Mock the file system checks made while locating the CI directory and fly script."""
+        with patch('os.path.isdir') as mock_isdir, patch.multiple(
+            'os', scandir=DEFAULT, access=DEFAULT
+        ) as os_mocks:
+            self.mock_isdir = mock_isdir
+            self.mock_scandir = os_mocks['scandir']
+            self.mock_access = os_mocks['access']
+
+            # Set up default mock behavior
+            self.mock_isdir.side_effect = lambda p: os.fspath(p) == self.expected_ci_dir
+            self.mock_scandir.return_value = [make_dir_entry('fly.sh')]
+            self.mock_access.return_value = True
+            yield
+
+    @pytest.fixture(scope='class')
+    @classmethod
+    def shared_runner(cls):
+        """One runner for the whole class; tests that change its state build their own."""
+        with patch(
+            'os.path.isdir', side_effect=lambda p: os.fspath(p) == cls.expected_ci_dir
+        ), patch.multiple(
+            'os',
+            scandir=MagicMock(return_value=[make_dir_entry('fly.sh')]),
+            access=MagicMock(return_value=True),
+        ):
+            return PipelineRunner(cls.foundation, cls.repo, cls.pipeline)
+
+    @pytest.fixture(autouse=True)
+    def setup(self, mock_os, shared_runner, monkeypatch):
+        """Set up a runner that behaves as if run from a terminal."""
+        # Behave as if run from a terminal unless a test says otherwise
+        with patch.object(PipelineRunner, '_is_interactive', return_value=True) as mock_interactive:
+            self.mock_interactive = mock_interactive
+
+            # Answer prompts with self.answer instead of reading stdin
+            self.answer = ''
+            self.prompts = []
+            monkeypatch.setattr('builtins.input', self._input)
+
+            self.pipeline_runner = shared_runner
+            yield
+
+    def _input(self, prompt=''):
+        """Stand-in for input() that records the prompt and returns self.answer.
+
+        An exception class as the answer is raised instead, e.g. EOFError for empty stdin.
+        """
+        self.prompts.append(prompt)
+        if isinstance(self.answer, type):
+            raise self.answer
+        return self.answer
 
     def test_initialization(self):
         """Test that the PipelineRunner is initialized correctly."""
-        self.assertEqual(self.pipeline_runner.foundation, self.foundation)
-        self.assertEqual(self.pipeline_runner.repo, self.repo)
-        self.assertEqual(self.pipeline_runner.pipeline, self.pipeline)
-        self.assertEqual(self.pipeline_runner.repo_ci_dir, self.expected_ci_dir)
+        assert self.pipeline_runner.foundation == self.foundation
+        assert self.pipeline_runner.repo == self.repo
+        assert self.pipeline_runner.pipeline == self.pipeline
+        assert self.pipeline_runner.repo_ci_dir == self.expected_ci_dir
 
     def test_initialization_with_existing_path(self):
         """Test initialization when repo is a path."""
         test_path = '/path/to/ci'
-        self.mock_exists.side_effect = lambda path: True
-        self.mock_listdir.return_value = ['fly.sh']
-        self.mock_isfile.return_value = True
-        self.mock_access.return_value = True
+        self.mock_isdir.side_effect = lambda path: True
 
         runner = PipelineRunner(self.foundation, test_path, self.pipeline)
-        self.assertEqual(runner.repo_ci_dir, test_path)
+        assert runner.repo_ci_dir == test_path
 
     def test_initialization_no_fly_script(self):
         """Test initialization when no fly script is found."""
-        self.mock_exists.side_effect = lambda path: True
-        self.mock_listdir.return_value = []
+        self.mock_isdir.side_effect = lambda path: True
+        self.mock_scandir.return_value = [make_dir_entry('fly.sh', is_file=False)]
 
-        with self.assertRaises(ValueError) as cm:
+        with pytest.raises(ValueError, match='No executable fly script found'):
+            PipelineRunner(self.foundation, self.repo, self.pipeline)
+
+    def test_initialization_no_ci_directory(self):
+        """Test initialization when no CI directory can be found."""
+        self.mock_isdir.side_effect = lambda path: False
+
+        with pytest.raises(ValueError, match='Could not find CI directory'):
             PipelineRunner(self.foundation, self.repo, self.pipeline)
-        self.assertIn('No executable fly script found', str(cm.exception))
 
     def test_run_fly_script(self):
-        """Test running fly script with a command."""
-        command = '-f "test" -r "message"'
+        """Test running fly script with its arguments."""
         with patch('subprocess.run') as mock_run:
-            mock_run.return_value = MagicMock(returncode=0)
-            self.assertTrue(self.pipeline_runner._run_fly_script(command))
+            mock_run.return_value = OK_PROCESS
+            assert self.pipeline_runner._run_fly_script('-f', 'test', '-r', 'message')
             mock_run.assert_called_once_with(
-                f'echo "y" | {self.pipeline_runner.fly_script} {command}',
+                [self.pipeline_runner.fly_script, '-f', 'test', '-r', 'message'],
+                input=b'y\n',
                 check=True,
-                shell=True,
                 cwd=self.expected_ci_dir,
             )
 
     def test_run_fly_script_error(self):
         """Test running fly script when it fails."""
-        command = '-f "test"'
         with patch('subprocess.run') as mock_run:
             mock_run.side_effect = subprocess.CalledProcessError(1, 'fly.sh')
             with patch('builtins.print') as mock_print:
-                self.assertFalse(self.pipeline_runner._run_fly_script(command))
+                assert not self.pipeline_runner._run_fly_script('-f', 'test')
                 mock_print.assert_called_once()
 
+    def test_run_pipeline_release_message_with_quotes(self):
+        """Test a release message with quotes reaches the fly script unchanged."""
+        message_body = 'Fix the "latest" tag\'s lookup'
+        self.answer = 'y'
+        with patch('subprocess.run', return_value=OK_PROCESS) as mock_run, patch.object(
+            self.pipeline_runner, '_pull_latest_changes', return_value=True
+        ):
+            assert self.pipeline_runner.run_pipeline('release', message_body)
+
+        fly_argv = mock_run.call_args_list[0].args[0]
+        assert fly_argv == [
+            self.pipeline_runner.fly_script,
+            '-f',
+            self.foundation,
+            '-r',
+            message_body,
+        ]
+
     def test_run_pipeline_release_success(self):
         """Test successful release pipeline run."""
         message_body = 'test message'
-        with patch.object(
-            self.pipeline_runner, '_verify_ci_directory'
-        ) as mock_verify, patch.object(
-            self.pipeline_runner, '_get_user_confirmation'
-        ) as mock_confirm, patch.object(
-            self.pipeline_runner, '_run_fly_script'
-        ) as mock_fly, patch.object(
-            self.pipeline_runner, '_unpause_pipeline'
-        ) as mock_unpause, patch.object(
-            self.pipeline_runner, '_trigger_job'
-        ) as mock_trigger, patch.object(self.pipeline_runner, '_watch_job') as mock_watch, patch(
-            'builtins.input'
-        ) as mock_input, patch.object(self.pipeline_runner, '_pull_latest_changes') as mock_pull:
+        with patch.multiple(
+            self.pipeline_runner,
+            _verify_ci_directory=DEFAULT,
+            _get_user_confirmation=DEFAULT,
+            _run_fly_script=DEFAULT,
+            _unpause_pipeline=DEFAULT,
+            _trigger_job=DEFAULT,
+            _watch_job=DEFAULT,
+            _pull_latest_changes=DEFAULT,
+        ) as mocks:
             # Set up all mocks to return True
-            mock_verify.return_value = True
-            mock_confirm.return_value = True
-            mock_fly.return_value = True
-            mock_unpause.return_value = True
-            mock_trigger.return_value = True
-            mock_watch.return_value = True
-            mock_input.return_value = ''
-            mock_pull.return_value = True
+            for mock in mocks.values():
+                mock.return_value = True
 
-            self.assertTrue(self.pipeline_runner.run_pipeline('release', message_body))
-            mock_fly.assert_called_once_with(f'-f "{self.foundation}" -r "{message_body}"')
+            assert self.pipeline_runner.run_pipeline('release', message_body)
+            mocks['_run_fly_script'].assert_called_once_with(
+                '-f', self.foundation, '-r', message_body
+            )
 
     def test_run_pipeline_set_success(self):
         """Test successful set pipeline run."""
-        with patch.object(
-            self.pipeline_runner, '_verify_ci_directory'
-        ) as mock_verify, patch.object(
-            self.pipeline_runner, '_get_user_confirmation'
-        ) as mock_confirm, patch.object(
-            self.pipeline_runner, '_run_fly_script'
-        ) as mock_fly, patch.object(
-            self.pipeline_runner, '_unpause_pipeline'
-        ) as mock_unpause, patch.object(
-            self.pipeline_runner, '_trigger_job'
-        ) as mock_trigger, patch('builtins.input') as mock_input:
+        with patch.multiple(
+            self.pipeline_runner,
+            _verify_ci_directory=DEFAULT,
+            _get_user_confirmation=DEFAULT,
+            _run_fly_script=DEFAULT,
+            _unpause_pipeline=DEFAULT,
+            _trigger_job=DEFAULT,
+        ) as mocks:
             # Set up all mocks to return True
-            mock_verify.return_value = True
-            mock_confirm.return_value = True
-            mock_fly.return_value = True
-            mock_unpause.return_value = True
-            mock_trigger.return_value = True
-            mock_input.return_value = ''
-
-            self.assertTrue(self.pipeline_runner.run_pipeline('set'))
-            mock_fly.assert_called_once_with(f'-f "{self.foundation}" -s')
-
-    def test_info_message(self):
-        """Test that info messages are printed with cyan color."""
-        with patch('builtins.print') as mock_print:
-            self.pipeline_runner.info('Test message')
-            mock_print.assert_called_once_with(
-                f'{self.pipeline_runner.CYAN}Test message{self.pipeline_runner.NOCOLOR}'
-            )
-
-    def test_warn_message(self):
-        """Test that warning messages are printed with yellow color."""
-        with patch('builtins.print') as mock_print:
-            self.pipeline_runner.warn('Test message')
-            mock_print.assert_called_once_with(
-                f'{self.pipeline_runner.YELLOW}Test message{self.pipeline_runner.NOCOLOR}'
-            )
-
-    def test_error_message(self):
-        """Test that error messages are printed with red color."""
-        with patch('builtins.print') as mock_print:
-            self.pipeline_runner.error('Test message')
-            mock_print.assert_called_once_with(
-                f'{self.pipeline_runner.RED}Test message{self.pipeline_runner.NOCOLOR}'
-            )
-
-    def test_completed_message(self):
-        """Test that completed messages are printed with green color."""
+            for mock in mocks.values():
+                mock.return_value = True
+
+            assert self.pipeline_runner.run_pipeline('set')
+            mocks['_run_fly_script'].assert_called_once_with('-f', self.foundation, '-s')
+
+    @pytest.mark.parametrize(
+        'method, color',
+        [('info', 'CYAN'), ('warn', 'YELLOW'), ('error', 'RED'), ('completed', 'GREEN')],
+    )
+    def test_color_message(self, method, color):
+        """Test that each message kind is printed in its color."""
+        expected = f'{getattr(PipelineRunner, color)}Test message{PipelineRunner.NOCOLOR}'
         with patch('builtins.print') as mock_print:
-            self.pipeline_runner.completed('Test message')
-            mock_print.assert_called_once_with(
-                f'{self.pipeline_runner.GREEN}Test message{self.pipeline_runner.NOCOLOR}'
-            )
+            getattr(self.pipeline_runner, method)('Test message')
+            mock_print.assert_called_once_with(expected)
 
     def test_verify_ci_directory_exists(self):
         """Test CI directory verification when directory exists."""
-        with patch('os.path.exists') as mock_exists:
-            mock_exists.return_value = True
-            self.assertTrue(self.pipeline_runner._verify_ci_directory())
+        runner = PipelineRunner(self.foundation, self.repo, self.pipeline)
+        self.mock_isdir.side_effect = None
+        self.mock_isdir.return_value = True
+        runner.invalidate_ci_cache()
+        assert runner._verify_ci_directory()
+
+    def test_verify_ci_directory_cached(self):
+        """Test that the directory found at initialization isn't checked again."""
+        self.mock_isdir.reset_mock()
+        assert self.pipeline_runner._verify_ci_directory()
+        self.mock_isdir.assert_not_called()
 
     def test_verify_ci_directory_missing(self):
         """Test CI directory verification when directory doesn't exist."""
-        with patch('os.path.exists') as mock_exists:
-            mock_exists.return_value = False
-            with patch('builtins.print') as mock_print:
-                self.assertFalse(self.pipeline_runner._verify_ci_directory())
-                mock_print.assert_called_once()
+        runner = PipelineRunner(self.foundation, self.repo, self.pipeline)
+        self.mock_isdir.side_effect = None
+        self.mock_isdir.return_value = False
+        runner.invalidate_ci_cache()
+        with patch('builtins.print') as mock_print:
+            assert not runner._verify_ci_directory()
+            mock_print.assert_called_once()
 
     def test_get_user_confirmation_yes(self):
         """Test user confirmation when user inputs 'yes'."""
-        with patch('builtins.input') as mock_input:
-            mock_input.return_value = 'yes'
-            self.assertTrue(self.pipeline_runner._get_user_confirmation('Test'))
+        self.answer = 'yes'
+        assert self.pipeline_runner._get_user_confirmation('Test')
 
     def test_get_user_confirmation_no(self):
         """Test user confirmation when user inputs 'no'."""
-        with patch('builtins.input') as mock_input:
-            mock_input.return_value = 'no'
-            self.assertFalse(self.pipeline_runner._get_user_confirmation('Test'))
-
-    def test_unpause_pipeline(self):
-        """Test unpausing the pipeline."""
-        with patch('subprocess.run') as mock_run:
-            mock_run.return_value = MagicMock(returncode=0)
-            self.assertTrue(self.pipeline_runner._unpause_pipeline())
-            mock_run.assert_called_once_with(
-                ['fly', '-t', self.foundation, 'unpause-pipeline', '-p', self.pipeline],
-                check=True,
-                cwd=self.expected_ci_dir,
-            )
-
-    def test_trigger_job_without_watch(self):
-        """Test triggering a job without watching."""
-        job_name = 'test-job'
-        with patch('subprocess.run') as mock_run:
-            mock_run.return_value = MagicMock(returncode=0)
-            self.assertTrue(self.pipeline_runner._trigger_job(job_name))
-            mock_run.assert_called_once_with(
-                ['fly', '-t', self.foundation, 'trigger-job', '-j', f'{self.pipeline}/{job_name}'],
-                check=True,
-                cwd=self.expected_ci_dir,
-            )
-
-    def test_trigger_job_with_watch(self):
-        """Test triggering a job with watching."""
-        job_name = 'test-job'
+        self.answer = 'no'
+        assert not self.pipeline_runner._get_user_confirmation('Test')
+
+    def test_get_user_confirmation_reads_piped_stdin(self):
+        """Test that an answer piped in is used even though stdin is not a terminal."""
+        self.mock_interactive.return_value = False
+        self.answer = 'y'
+        assert self.pipeline_runner._get_user_confirmation('Test')
+        assert len(self.prompts) == 1
+
+    def test_get_user_confirmation_at_eof(self, capsys):
+        """Test that the default is used, and said so, when stdin has no answer left."""
+        self.answer = EOFError
+        assert not self.pipeline_runner._get_user_confirmation('Test')
+        assert self.pipeline_runner._get_user_confirmation('Test', default='y')
+        assert 'No answer on stdin to "Test"; using the default (n)' in capsys.readouterr().out
+
+    def test_run_pipeline_reports_declined_run(self, capsys):
+        """Test that a run declined at the prompt says why it stopped."""
+        self.answer = EOFError
         with patch('subprocess.run') as mock_run:
-            mock_run.return_value = MagicMock(returncode=0)
-            self.assertTrue(self.pipeline_runner._trigger_job(job_name, watch=True))
-            mock_run.assert_called_once_with(
+            assert not self.pipeline_runner.run_pipeline('set')
+        mock_run.assert_not_called()
+        assert 'Not running the set pipeline: it was not confirmed' in capsys.readouterr().out
+
+    @pytest.mark.parametrize(
+        'method, args, kwargs, expected_argv',
+        [
+            pytest.param(
+                '_unpause_pipeline',
+                (),
+                {},
+                ['fly', '-t', 'test-foundation', 'unpause-pipeline', '-p', 'test-pipeline'],
+                id='unpause_pipeline',
+            ),
+            pytest.param(
+                '_trigger_job',
+                ('test-job',),
+                {},
+                ['fly', '-t', 'test-foundation', 'trigger-job', '-j', 'test-pipeline/test-job'],
+                id='trigger_job_without_watch',
+            ),
+            pytest.param(
+                '_trigger_job',
+                ('test-job',),
+                {'watch': True},
                 [
                     'fly',
                     '-t',
-                    self.foundation,
+                    'test-foundation',
                     'trigger-job',
                     '-j',
-                    f'{self.pipeline}/{job_name}',
+                    'test-pipeline/test-job',
                     '-w',
                 ],
-                check=True,
-                cwd=self.expected_ci_dir,
-            )
-
-    def test_watch_job(self):
-        """Test watching a job."""
-        job_name = 'test-job'
-        with patch('subprocess.run') as mock_run:
-            mock_run.return_value = MagicMock(returncode=0)
-            self.assertTrue(self.pipeline_runner._watch_job(job_name))
-            mock_run.assert_called_once_with(
-                ['fly', '-t', self.foundation, 'watch', '-j', f'{self.pipeline}/{job_name}'],
-                check=True,
-                cwd=self.expected_ci_dir,
-            )
-
-    def test_pull_latest_changes(self):
-        """Test pulling latest git changes."""
+                id='trigger_job_with_watch',
+            ),
+            pytest.param(
+                '_watch_job',
+                ('test-job',),
+                {},
+                ['fly', '-t', 'test-foundation', 'watch', '-j', 'test-pipeline/test-job'],
+                id='watch_job',
+            ),
+            pytest.param(
+                '_pull_latest_changes', (), {}, ['git', 'pull', '-q'], id='pull_latest_changes'
+            ),
+        ],
+    )
+    def test_runs_command(self, method, args, kwargs, expected_argv):
+        """Test that each pipeline step runs its command in the CI directory."""
         with patch('subprocess.run') as mock_run:
-            mock_run.return_value = MagicMock(returncode=0)
-            self.assertTrue(self.pipeline_runner._pull_latest_changes())
-            mock_run.assert_called_once_with(
-                ['git', 'pull', '-q'], check=True, cwd=self.expected_ci_dir
-            )
+            mock_run.return_value = OK_PROCESS
+            assert getattr(self.pipeline_runner, method)(*args, **kwargs)
+            mock_run.assert_called_once_with(expected_argv, check=True, cwd=self.expected_ci_dir)
 
     def test_run_pipeline_invalid_type(self):
         """Test running pipeline with invalid type."""
@@ -277,7 +321,7 @@ class TestPipelineRunner(unittest.TestCase):
             'builtins.print'
         ) as mock_print:
             mock_confirm.return_value = True
-            self.assertFalse(self.pipeline_runner.run_pipeline('invalid'))
+            assert not self.pipeline_runner.run_pipeline('invalid')
             mock_print.assert_called_with(
                 f'{self.pipeline_runner.RED}Invalid pipeline type: invalid'
                 f'{self.pipeline_runner.NOCOLOR}'
@@ -287,7 +331,7 @@ class TestPipelineRunner(unittest.TestCase):
         """Test pipeline run when user cancels."""
         with patch.object(self.pipeline_runner, '_get_user_confirmation') as mock_confirm:
             mock_confirm.return_value = False
-            self.assertFalse(self.pipeline_runner.run_pipeline('release'))
+            assert not self.pipeline_runner.run_pipeline('release')
 
     def test_run_pipeline_ci_directory_missing(self):
         """Test pipeline run when CI directory is missing."""
@@ -298,7 +342,7 @@ class TestPipelineRunner(unittest.TestCase):
         ) as mock_confirm:
             mock_verify.return_value = False
             mock_confirm.return_value = True
-            self.assertFalse(self.pipeline_runner.run_pipeline('release'))
+            assert not self.pipeline_runner.run_pipeline('release')
 
     def test_run_pipeline_step_failure(self):
         """Test pipeline run when a step fails."""
@@ -306,27 +350,48 @@ class TestPipelineRunner(unittest.TestCase):
             self.pipeline_runner, '_verify_ci_directory'
         ) as mock_verify, patch.object(
             self.pipeline_runner, '_get_user_confirmation'
-        ) as mock_confirm, patch.object(self.pipeline_runner, '_run_fly_script') as mock_fly:
+        ) as mock_confirm, patch.object(
+            self.pipeline_runner, '_run_fly_script'
+        ) as mock_fly, patch.object(self.pipeline_runner, '_unpause_pipeline') as mock_unpause:
             mock_verify.return_value = True
             mock_confirm.return_value = True
             mock_fly.return_value = False
-            self.assertFalse(self.pipeline_runner.run_pipeline('release'))
+            assert not self.pipeline_runner.run_pipeline('release')
+            mock_unpause.assert_not_called()
 
     def test_backward_compatibility_release_pipeline(self):
         """Test backward compatibility of run_release_pipeline."""
         message_body = 'test message'
         with patch.object(self.pipeline_runner, 'run_pipeline') as mock_run_pipeline:
             mock_run_pipeline.return_value = True
-            self.assertTrue(self.pipeline_runner.run_release_pipeline(message_body))
+            assert self.pipeline_runner.run_release_pipeline(message_body)
             mock_run_pipeline.assert_called_once_with('release', message_body)
 
     def test_backward_compatibility_set_pipeline(self):
         """Test backward compatibility of run_set_pipeline."""
         with patch.object(self.pipeline_runner, 'run_pipeline') as mock_run_pipeline:
             mock_run_pipeline.return_value = True
-            self.assertTrue(self.pipeline_runner.run_set_pipeline())
+            assert self.pipeline_runner.run_set_pipeline()
             mock_run_pipeline.assert_called_once_with('set')
 
 
-if __name__ == '__main__':
-    unittest.main()
+class TestInteractiveDetection:
+    """Test cases for detecting whether prompts can be answered."""
+
+    def test_terminal_is_interactive(self):
+        """Test that a terminal outside CI is interactive."""
+        with patch.dict(os.environ, {}, clear=True), patch('sys.stdin') as mock_stdin:
+            mock_stdin.isatty.return_value = True
+            assert PipelineRunner._is_interactive()
+
+    def test_ci_is_not_interactive(self):
+        """Test that a CI environment is never treated as interactive."""
+        with patch.dict(os.environ, {'CI': 'true'}), patch('sys.stdin') as mock_stdin:
+            mock_stdin.isatty.return_value = True
+            assert not PipelineRunner._is_interactive()
+
+    def test_piped_stdin_is_not_interactive(self):
+        """Test that piped stdin is not treated as interactive."""
+        with patch.dict(os.environ, {}, clear=True), patch('sys.stdin') as mock_stdin:
+            mock_stdin.isatty.return_value = False
+            assert not PipelineRunner._is_interactive()
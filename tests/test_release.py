@@ -1,85 +1,85 @@
-from unittest.mock import MagicMock, call, patch
+import re
+from contextlib import ExitStack
+from types import SimpleNamespace
+from unittest.mock import DEFAULT, Mock, call, patch
 
+import click
 import pytest
-from click.testing import CliRunner
 
 from voyager.commands.release import create_release
 
+# Every test here only touches mocks or the module's temporary directory
+pytestmark = pytest.mark.parallel
 
-@pytest.fixture
-def mock_repo():
-    """Mock GitRepo object with necessary methods and properties."""
-    mock = MagicMock()
-    # Mock the active_branch property to return an object with a name attribute
-    mock_branch = MagicMock()
-    mock_branch.name = 'main'
-    mock.active_branch = mock_branch
+# Option values click resolves when none are given, for calling the callback directly
+DEFAULT_PARAMS = create_release.make_context('release', []).params
 
-    # Mock the refs property
-    mock_refs = []
-    for branch_name in ['main', 'develop', 'feature/test', 'version']:
-        mock_ref = MagicMock()
-        mock_ref.name = branch_name
-        mock_refs.append(mock_ref)
-    mock.refs = mock_refs
+# Branches the mocked repository reports in its refs
+BRANCH_NAMES = ('main', 'develop', 'feature/test', 'version')
 
-    # Add a mock tags property
-    mock.tags = []
+# Repository attributes the release command touches
+REPO_ATTRS = ('active_branch', 'create_tag', 'git', 'refs')
 
-    return mock
+# git subcommands the release command runs through repo.git
+GIT_COMMANDS = ('add', 'branch', 'checkout', 'commit', 'fetch', 'merge', 'pull', 'push', 'rebase')
 
+# Backup branch the merge strategies create from 'main', suffixed with a timestamp
+BACKUP_BRANCH = re.compile(r'backup-main-\d{14}$')
 
-@pytest.fixture
+
+@pytest.fixture(scope='module')
 def mock_env_setup():
-    """Mock environment setup including Git operations."""
-    with patch('git.Repo') as mock_git_repo, patch(
-        'voyager.commands.release.check_git_repo', return_value=True
-    ), patch(
-        'voyager.commands.release.get_repo_info', return_value=('test-owner', 'test-repo')
-    ), patch('voyager.commands.release.GitHubClient') as mock_github_client, patch(
-        'voyager.commands.release.VersionFinder'
-    ) as mock_version_finder, patch(
-        'voyager.commands.release.VersionUpdater'
-    ) as mock_version_updater:
-        # Set up mock repo
-        mock_repo_instance = mock_git_repo.return_value
-        mock_branch = MagicMock()
-        mock_branch.name = 'main'
-        mock_repo_instance.active_branch = mock_branch
-
-        # Mock refs for branch existence check
-        mock_refs = []
-        for branch_name in ['main', 'develop', 'feature/test', 'version']:
-            mock_ref = MagicMock()
-            mock_ref.name = branch_name
-            mock_refs.append(mock_ref)
-        mock_repo_instance.refs = mock_refs
-
-        # Mock git operations
-        mock_repo_instance.git = MagicMock()
-        mock_repo_instance.git.checkout = MagicMock()
-        mock_repo_instance.git.add = MagicMock()
-        mock_repo_instance.git.commit = MagicMock()
-        mock_repo_instance.git.push = MagicMock()
-        mock_repo_instance.create_tag = MagicMock()
+    """Mock environment setup including Git operations, patched once for the whole module."""
+    with ExitStack() as stack:
+        mock_git_repo = stack.enter_context(patch('git.Repo'))
+        release_mocks = stack.enter_context(
+            patch.multiple(
+                'voyager.commands.release',
+                check_git_repo=lambda: True,
+                get_repo_info=lambda: ('test-owner', 'test-repo'),
+                GitHubClient=DEFAULT,
+                VersionFinder=DEFAULT,
+                VersionUpdater=DEFAULT,
+            )
+        )
+        mock_github_client = release_mocks['GitHubClient']
+        mock_version_finder = release_mocks['VersionFinder']
+        mock_version_updater = release_mocks['VersionUpdater']
+        # Tests answer prompts through return_value/side_effect; otherwise the real one runs
+        mock_confirm = stack.enter_context(patch('click.confirm', wraps=click.confirm))
+
+        # Set up mock repo, limited to the attributes the release command reads
+        mock_repo_instance = mock_git_repo.return_value = Mock(spec_set=REPO_ATTRS)
+        mock_repo_instance.active_branch = SimpleNamespace(name='main')
+
+        # Refs for the branch existence check, which only reads their names
+        mock_repo_instance.refs = [SimpleNamespace(name=name) for name in BRANCH_NAMES]
+
+        # Only the git commands release runs, so a misspelt one fails instead of passing silently
+        mock_repo_instance.git = Mock(spec_set=GIT_COMMANDS)
 
         # Mock VersionFinder
-        finder_instance = mock_version_finder.return_value
-        finder_instance.get_current_version.return_value = (
-            '0.1.0',
-            'pyproject.toml',
-            r'version="([^"]*)"',
+        mock_version_finder.configure_mock(
+            **{
+                'return_value.get_current_version.return_value': (
+                    '0.1.0',
+                    'pyproject.toml',
+                    r'version="([^"]*)"',
+                )
+            }
         )
 
-        # Mock VersionUpdater
-        updater_instance = mock_version_updater.return_value
-        updater_instance.update_version.return_value = False  # Not committed by updater
+        # Mock VersionUpdater; not committed by updater
+        mock_version_updater.configure_mock(**{'return_value.update_version.return_value': False})
 
         # Mock GitHub client
-        github_instance = mock_github_client.return_value
-        github_instance.create_release.return_value = {
-            'html_url': 'https://github.com/test/test/releases/v1.0.0'
-        }
+        mock_github_client.configure_mock(
+            **{
+                'return_value.create_release.return_value': {
+                    'html_url': 'https://github.com/test/test/releases/v1.0.0'
+                }
+            }
+        )
 
         yield {
             'git_repo': mock_git_repo,
@@ -87,317 +87,207 @@ def mock_env_setup():
             'github_client': mock_github_client,
             'version_finder': mock_version_finder,
             'version_updater': mock_version_updater,
+            'confirm': mock_confirm,
         }
 
 
-def test_release_branch_switching_checkout(mock_env_setup):
-    """Test release command with checkout strategy for a different branch."""
-    runner = CliRunner()
-
-    # Create a test environment
-    with runner.isolated_filesystem():
-        # Mock click.confirm to always return True
-        with patch('click.confirm', return_value=True):
-            # Run the release command with a release branch different from the current one
-            # Use --merge-strategy parameter to set checkout strategy
-            result = runner.invoke(
-                create_release,
-                ['--release-branch', 'develop', '--type', 'minor', '--merge-strategy', 'checkout'],
-            )
-
-            # Check the command executed successfully
-            assert result.exit_code == 0
-
-            # Check that git checkout was called with the right branch
-            mock_env_setup['repo_instance'].git.checkout.assert_any_call('develop')
-
-            # Ensure the command output indicates a branch switch
-            assert 'is different from working branch' in result.output
-            assert "Checking out branch 'develop'" in result.output
-            assert "Switched to branch 'develop'" in result.output
-
-
-def test_release_branch_with_rebase(mock_env_setup):
-    """Test release command with rebase strategy for a different branch."""
-    runner = CliRunner()
-
-    # Set up mock methods that may not exist yet
-    mock_env_setup['repo_instance'].git.rebase = MagicMock()
-    mock_env_setup['repo_instance'].git.fetch = MagicMock()
-    mock_env_setup['repo_instance'].git.pull = MagicMock()
-    mock_env_setup['repo_instance'].git.branch = MagicMock()
-
-    # Create a test environment
-    with runner.isolated_filesystem():
-        # Run the release command with rebase strategy
-        result = runner.invoke(
-            create_release,
-            ['--release-branch', 'develop', '--type', 'minor', '--merge-strategy', 'rebase'],
-        )
-
-        # Check the command executed successfully
-        assert result.exit_code == 0
-
-        # Verify git operations were called
-        mock_env_setup['repo_instance'].git.fetch.assert_any_call('origin', 'develop')
-        mock_env_setup['repo_instance'].git.fetch.assert_any_call('origin', 'main')
-
-        # Check that a backup branch was created
-        checkout_calls = str(mock_env_setup['repo_instance'].git.checkout.call_args_list)
-        assert "'-b', 'backup-main-" in checkout_calls
-
-        # Check that we switched to the target branch
-        mock_env_setup['repo_instance'].git.checkout.assert_any_call('develop')
-
-        # Check that we tried to pull the latest changes
-        mock_env_setup['repo_instance'].git.pull.assert_called_with('origin', 'develop')
-
-        # Check rebase was called with the backup branch
-        # Note: We're checking if rebase was called, but not the exact parameter
-        # because the branch name includes a timestamp
-        assert mock_env_setup['repo_instance'].git.rebase.called
-
-        # Check backup branch was deleted
-        assert mock_env_setup['repo_instance'].git.branch.called
-        branch_calls = str(mock_env_setup['repo_instance'].git.branch.call_args_list)
-        assert "'-D', 'backup-main-" in branch_calls
-
-        # Verify output message contains rebase text
-        assert "Rebasing changes from 'main' onto 'develop'" in result.output
-
-
-def test_release_branch_with_merge(mock_env_setup):
-    """Test release command with merge strategy for a different branch."""
-    runner = CliRunner()
-
-    # Set up mock methods that may not exist yet
-    mock_env_setup['repo_instance'].git.merge = MagicMock()
-    mock_env_setup['repo_instance'].git.fetch = MagicMock()
-    mock_env_setup['repo_instance'].git.pull = MagicMock()
-    mock_env_setup['repo_instance'].git.branch = MagicMock()
-
-    # Create a test environment
-    with runner.isolated_filesystem():
-        # Run the release command with merge strategy
-        result = runner.invoke(
-            create_release,
-            ['--release-branch', 'develop', '--type', 'minor', '--merge-strategy', 'merge'],
-        )
-
-        # Check the command executed successfully
-        assert result.exit_code == 0
-
-        # Verify git operations were called
-        mock_env_setup['repo_instance'].git.fetch.assert_any_call('origin', 'develop')
-        mock_env_setup['repo_instance'].git.fetch.assert_any_call('origin', 'main')
-
-        # Check that a backup branch was created
-        checkout_calls = str(mock_env_setup['repo_instance'].git.checkout.call_args_list)
-        assert "'-b', 'backup-main-" in checkout_calls
-
-        # Check that we switched to the target branch
-        mock_env_setup['repo_instance'].git.checkout.assert_any_call('develop')
-
-        # Check that we tried to pull the latest changes
-        mock_env_setup['repo_instance'].git.pull.assert_called_with('origin', 'develop')
-
-        # Check merge was called with --no-ff
-        mock_env_setup['repo_instance'].git.merge.assert_called_with('main', '--no-ff')
-
-        # Check backup branch was deleted
-        assert mock_env_setup['repo_instance'].git.branch.called
-        branch_calls = str(mock_env_setup['repo_instance'].git.branch.call_args_list)
-        assert "'-D', 'backup-main-" in branch_calls
-
-        # Verify output message contains merge text
-        assert "Merging changes from 'main' into 'develop'" in result.output
-
-
-def test_release_branch_with_squash_merge(mock_env_setup):
-    """Test release command with squash merge strategy for a different branch."""
-    runner = CliRunner()
-
-    # Set up mock methods that may not exist yet
-    mock_env_setup['repo_instance'].git.merge = MagicMock()
-    mock_env_setup['repo_instance'].git.fetch = MagicMock()
-    mock_env_setup['repo_instance'].git.pull = MagicMock()
-    mock_env_setup['repo_instance'].git.branch = MagicMock()
-
-    # Create a test environment
-    with runner.isolated_filesystem():
-        # Run the release command with squash merge strategy
-        result = runner.invoke(
-            create_release,
-            ['--release-branch', 'develop', '--type', 'minor', '--merge-strategy', 'squash'],
-        )
-
-        # Check the command executed successfully
-        assert result.exit_code == 0
-
-        # Verify git operations were called
-        mock_env_setup['repo_instance'].git.fetch.assert_any_call('origin', 'develop')
-        mock_env_setup['repo_instance'].git.fetch.assert_any_call('origin', 'main')
-
-        # Check that a backup branch was created
-        checkout_calls = str(mock_env_setup['repo_instance'].git.checkout.call_args_list)
-        assert "'-b', 'backup-main-" in checkout_calls
-
-        # Check that we switched to the target branch
-        mock_env_setup['repo_instance'].git.checkout.assert_any_call('develop')
-
-        # Check that we tried to pull the latest changes
-        mock_env_setup['repo_instance'].git.pull.assert_called_with('origin', 'develop')
-
-        # Check merge was called with --squash
-        mock_env_setup['repo_instance'].git.merge.assert_called_with('main', '--squash')
-
-        # Verify commit was called with appropriate message
+@pytest.fixture(scope='module', autouse=True)
+def in_tmp_path(tmp_path_factory):
+    """Run the module's tests from one temporary directory; none of them write files."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.chdir(tmp_path_factory.mktemp('release'))
+        yield
+
+
+@pytest.fixture(autouse=True)
+def reset_env_setup(mock_env_setup):
+    """Clear recorded calls and per-test side effects between tests."""
+    yield
+    # reset_mock() does not follow return_value, so the repo instance is reset on its own
+    for mock in mock_env_setup.values():
+        mock.reset_mock(side_effect=True)
+    # Drop any canned answer so click.confirm falls back to the wrapped prompt
+    mock_env_setup['confirm'].reset_mock(return_value=True)
+
+
+@pytest.mark.parametrize(
+    'strategy, message',
+    [
+        ('checkout', "Checking out branch 'develop'"),
+        ('rebase', "Rebasing changes from 'main' onto 'develop'"),
+        ('merge', "Merging changes from 'main' into 'develop'"),
+        ('squash', "Squash merging changes from 'main' into 'develop'"),
+    ],
+)
+def test_release_branch_merge_strategy(mock_env_setup, strategy, message, capsys):
+    """Test release command with each merge strategy for a different branch."""
+    git_ops = mock_env_setup['repo_instance'].git
+
+    # Mock click.confirm to always return True
+    mock_env_setup['confirm'].return_value = True
+
+    # Run in-process without standalone mode, so any failure raises here
+    create_release.main(
+        ['--release-branch', 'develop', '--type', 'minor', '--merge-strategy', strategy],
+        prog_name='release',
+        standalone_mode=False,
+    )
+    output = capsys.readouterr().out
+
+    # Snapshot the checkout arguments once for the membership checks below
+    checkout_calls = {c.args for c in git_ops.checkout.call_args_list}
+
+    # Check that we switched to the target branch
+    assert ('develop',) in checkout_calls
+
+    # Verify output message names the strategy being applied
+    assert message in output
+
+    if strategy == 'checkout':
+        # Ensure the command output indicates a branch switch
+        assert 'is different from working branch' in output
+        assert "Switched to branch 'develop'" in output
+        return
+
+    # Verify the release branch is fetched before the working branch
+    git_ops.fetch.assert_has_calls([call('origin', 'develop'), call('origin', 'main')])
+
+    # Check that a backup branch was created
+    assert any(args[:1] == ('-b',) and BACKUP_BRANCH.match(args[1]) for args in checkout_calls)
+
+    # Check that we tried to pull the latest changes
+    git_ops.pull.assert_called_with('origin', 'develop')
+
+    if strategy == 'rebase':
+        # The backup branch name includes a timestamp, so only check rebase ran
+        assert git_ops.rebase.called
+    elif strategy == 'merge':
+        git_ops.merge.assert_called_with('main', '--no-ff')
+    else:
+        git_ops.merge.assert_called_with('main', '--squash')
         # Using any_call because we have other commits in the test
-        mock_env_setup['repo_instance'].git.commit.assert_any_call(
-            '-m', "Squashed merge of 'main' into 'develop' for release"
-        )
+        git_ops.commit.assert_any_call('-m', "Squashed merge of 'main' into 'develop' for release")
 
-        # Check backup branch was deleted
-        assert mock_env_setup['repo_instance'].git.branch.called
-        branch_calls = str(mock_env_setup['repo_instance'].git.branch.call_args_list)
-        assert "'-D', 'backup-main-" in branch_calls
+    # Check backup branch was deleted
+    assert any(
+        c.args[:1] == ('-D',) and BACKUP_BRANCH.match(c.args[1])
+        for c in git_ops.branch.call_args_list
+    )
 
-        # Verify output message contains squash text
-        assert "Squash merging changes from 'main' into 'develop'" in result.output
 
-
-def test_release_nonexistent_branch(mock_env_setup):
+def test_release_nonexistent_branch(mock_env_setup, capsys):
     """Test the behavior when the specified branch doesn't exist."""
-    runner = CliRunner()
-
-    with runner.isolated_filesystem():
-        # Run the release command with a release branch that doesn't exist
-        result = runner.invoke(create_release, ['--release-branch', 'nonexistent-branch'])
+    # Only the early exit matters here, so call the callback without CliRunner's stdio isolation
+    params = {**DEFAULT_PARAMS, 'release_branch': 'nonexistent-branch'}
+    with click.Context(create_release), pytest.raises(SystemExit) as exc:
+        create_release.callback(**params)
 
-        # Check the command failed
-        assert result.exit_code == 1
+    # Check the command failed
+    assert exc.value.code == 1
 
-        # Check error message
-        assert "Error: Release branch 'nonexistent-branch' does not exist" in result.output
-        assert 'Available branches:' in result.output
+    # Check error message
+    output = capsys.readouterr().out
+    assert "Error: Release branch 'nonexistent-branch' does not exist" in output
+    assert 'Available branches:' in output
 
-        # Ensure git checkout was not called
-        mock_env_setup['repo_instance'].git.checkout.assert_not_called()
+    # Ensure git checkout was not called
+    mock_env_setup['repo_instance'].git.checkout.assert_not_called()
 
 
-def test_release_checkout_failure(mock_env_setup):
+def test_release_checkout_failure(mock_env_setup, runner):
     """Test the behavior when git checkout fails."""
-    runner = CliRunner()
-
     # Mock the git checkout to raise an exception
     mock_env_setup['repo_instance'].git.checkout.side_effect = Exception('Checkout failed')
 
-    with runner.isolated_filesystem():
-        # Mock click.confirm to always return False (abort on error)
-        with patch('click.confirm', return_value=False):
-            # Run the release command with catch_exceptions to see the output but not exit
-            result = runner.invoke(
-                create_release, ['--release-branch', 'develop'], catch_exceptions=True
-            )
-
-            # The actual command will exit, but we'll still see the output
-            # The exact error message might vary, but check for key parts
-            assert 'Checkout failed' in result.output
-            # It might not show "Release canceled" if it exits immediately on exception
-
-
-def test_release_branch_restoration_on_error(mock_env_setup):
-    """Test that the original branch is restored when an error occurs during release."""
-    runner = CliRunner()
-
-    # Make Repo() always return our mocked repo when called with any arguments
-    mock_env_setup['git_repo'].side_effect = lambda *args, **kwargs: mock_env_setup['repo_instance']
-
-    # Set up the test to fail at some point after branch switching
-    mock_env_setup['repo_instance'].git.push.side_effect = Exception('Push failed')
-
-    with runner.isolated_filesystem():
-        # Use catch_exceptions to see the output even if it exits
-        result = runner.invoke(
-            create_release, ['--release-branch', 'develop'], catch_exceptions=True
-        )
-
-        # The exit code will depend on how the command is structured
-        # We mainly want to check the restoration behavior
-
-        # Check that checkout was called for both branches
-        mock_env_setup['repo_instance'].git.checkout.assert_any_call('develop')
-
-        # Check for error message in the output
-        assert 'Push failed' in result.output
-
-
-def test_release_branch_restoration_on_success(mock_env_setup):
-    """Test that it offers to restore the original branch after a successful release."""
-    runner = CliRunner()
-
-    # Setup GitHub client mock to not throw errors
-    github_client_instance = mock_env_setup['github_client'].return_value
-    github_client_instance.create_release.return_value = {'html_url': 'https://example.com/release'}
-
-    with runner.isolated_filesystem():
-        # We need confirmations for releases and branch switching
-        with patch('click.confirm', side_effect=[True, True, True]):
-            # Run the release command with checkout strategy
-            result = runner.invoke(
-                create_release,
-                ['--release-branch', 'develop', '--merge-strategy', 'checkout'],
-                catch_exceptions=True,
-            )
-
-            # Check for branch switching messages in the output
-            assert "Checking out branch 'develop'" in result.output
-
-            # Verify the checkout call was to develop
-            mock_env_setup['repo_instance'].git.checkout.assert_any_call('develop')
-
-
-def test_release_with_same_branch(mock_env_setup):
+    # Mock click.confirm to always return False (abort on error)
+    mock_env_setup['confirm'].return_value = False
+
+    # Run the release command with catch_exceptions to see the output but not exit
+    result = runner.invoke(create_release, ['--release-branch', 'develop'], catch_exceptions=True)
+
+    # The actual command will exit, but we'll still see the output
+    # The exact error message might vary, but check for key parts
+    assert 'Checkout failed' in result.output
+    # It might not show "Release canceled" if it exits immediately on exception
+
+
+@pytest.mark.parametrize(
+    'args, push_error, confirms, expected',
+    [
+        pytest.param(
+            ['--release-branch', 'develop'],
+            Exception('Push failed'),
+            None,
+            'Push failed',
+            id='error',
+        ),
+        pytest.param(
+            ['--release-branch', 'develop', '--merge-strategy', 'checkout'],
+            None,
+            # We need confirmations for releases and branch switching
+            [True, True, True],
+            "Checking out branch 'develop'",
+            id='success',
+        ),
+    ],
+)
+def test_release_branch_restoration(mock_env_setup, args, push_error, confirms, expected, runner):
+    """Test that the original branch is handled when the release fails or succeeds."""
+    repo_instance = mock_env_setup['repo_instance']
+    if push_error:
+        # Set up the test to fail at some point after branch switching
+        repo_instance.git.push.side_effect = push_error
+
+    if confirms:
+        mock_env_setup['confirm'].side_effect = confirms
+
+    # Only the failing push needs catch_exceptions to see the output even if it exits
+    result = runner.invoke(create_release, args, catch_exceptions=push_error is not None)
+
+    # Check for the error or branch switching message in the output
+    assert expected in result.output
+
+    # Verify the checkout call was to develop
+    repo_instance.git.checkout.assert_any_call('develop')
+
+
+def test_release_with_same_branch(mock_env_setup, runner):
     """Test release when already on the specified branch."""
-    runner = CliRunner()
-
     # Set current branch to main, which is the default
 
-    with runner.isolated_filesystem():
-        # Run the release command without specifying a branch (defaults to main)
-        result = runner.invoke(create_release, [])
+    # Run the release command without specifying a branch (defaults to main)
+    result = runner.invoke(create_release, [], catch_exceptions=False)
 
-        # Check the command succeeded
-        assert result.exit_code == 0
+    # Check the command succeeded
+    assert result.exit_code == 0
 
-        # Ensure it doesn't try to switch branches
-        # Since we're already on main, checkout should not be called with 'main'
-        if mock_env_setup['repo_instance'].git.checkout.called:
-            for call_args in mock_env_setup['repo_instance'].git.checkout.call_args_list:
-                assert call_args != call('main')
+    # Ensure it doesn't try to switch branches
+    # Since we're already on main, checkout should not be called with 'main'
+    if mock_env_setup['repo_instance'].git.checkout.called:
+        for call_args in mock_env_setup['repo_instance'].git.checkout.call_args_list:
+            assert call_args != call('main')
 
-        # Should not contain branch switching messages
-        assert 'Switching to branch' not in result.output
+    # Should not contain branch switching messages
+    assert 'Switching to branch' not in result.output
 
 
-def test_dry_run_no_git_operations(mock_env_setup):
+def test_dry_run_no_git_operations(mock_env_setup, runner):
     """Test that dry run doesn't perform any Git operations."""
-    runner = CliRunner()
-
-    with runner.isolated_filesystem():
-        # Run the release command in dry-run mode
-        result = runner.invoke(create_release, ['--release-branch', 'develop', '--dry-run'])
+    # Run the release command in dry-run mode
+    result = runner.invoke(
+        create_release, ['--release-branch', 'develop', '--dry-run'], catch_exceptions=False
+    )
 
-        # Check the command succeeded
-        assert result.exit_code == 0
+    # Check the command succeeded
+    assert result.exit_code == 0
 
-        # Ensure it switched to the develop branch at some point
-        mock_env_setup['repo_instance'].git.checkout.assert_any_call('develop')
+    # Ensure it switched to the develop branch at some point
+    mock_env_setup['repo_instance'].git.checkout.assert_any_call('develop')
 
-        # But ensure no commits, tags, or pushes were made
-        mock_env_setup['repo_instance'].git.commit.assert_not_called()
-        mock_env_setup['repo_instance'].create_tag.assert_not_called()
-        mock_env_setup['repo_instance'].git.push.assert_not_called()
+    # But ensure no commits, tags, or pushes were made
+    mock_env_setup['repo_instance'].git.commit.assert_not_called()
+    mock_env_setup['repo_instance'].create_tag.assert_not_called()
+    mock_env_setup['repo_instance'].git.push.assert_not_called()
 
-        # Check for dry run message
-        assert 'DRY RUN MODE - No changes will be made' in result.output
+    # Check for dry run message
+    assert 'DRY RUN MODE - No changes will be made' in result.output
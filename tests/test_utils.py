@@ -0,0 +1,108 @@
+import subprocess
+from unittest.mock import patch
+
+import pytest
+
+from voyager.utils import check_git_repo, get_repo_info
+
+
+@pytest.fixture
+def git_dir(tmp_path, monkeypatch):
+    """Run the test from a freshly initialised git repository."""
+    subprocess.run(['git', 'init', '-q'], cwd=tmp_path, check=True)
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+def add_remote(name, url):
+    """Add a remote to the repository in the current directory."""
+    subprocess.run(['git', 'remote', 'add', name, url], check=True)
+
+
+@pytest.mark.parametrize(
+    'url',
+    [
+        'git@github.com:test-owner/test-repo.git',
+        'git@github.com:test-owner/test-repo',
+        'https://github.com/test-owner/test-repo.git',
+        'https://github.com/test-owner/test-repo',
+        'https://github.com/test-owner/test-repo/',
+        'ssh://git@github.com/test-owner/test-repo.git',
+        'https://github.com/test-owner/test-repo.git?ref=main',
+        'https://github.com/test-owner/test-repo#readme',
+        'https://github.com/test-owner/test-repo/tree/main',
+        'https://GitHub.com/test-owner/test-repo',
+    ],
+)
+def test_get_repo_info_parses_remote_url(git_dir, url):
+    """Test owner and repository are read from SSH and HTTPS origin URLs."""
+    add_remote('origin', url)
+    assert get_repo_info() == ('test-owner', 'test-repo')
+
+
+def test_get_repo_info_keeps_dots_in_repo_name(git_dir):
+    """Test a dotted repository name is kept whole, with only the .git suffix removed."""
+    add_remote('origin', 'git@github.com:test-owner/test.repo.git')
+    assert get_repo_info() == ('test-owner', 'test.repo')
+
+
+@pytest.mark.parametrize(
+    'remote',
+    [
+        pytest.param(None, id='no-remote'),
+        pytest.param(('upstream', 'git@github.com:test-owner/test-repo.git'), id='no-origin'),
+        pytest.param(('origin', 'git@gitlab.com:test-owner/test-repo.git'), id='not-github'),
+        pytest.param(('origin', 'git@github.com:test-owner/' + 'a' * 50_000 + '!'), id='malformed'),
+    ],
+)
+def test_get_repo_info_rejects_non_github_origin(git_dir, remote):
+    """Test a missing or non-GitHub origin remote is reported as a ValueError."""
+    if remote:
+        add_remote(*remote)
+    with pytest.raises(ValueError, match='Not a GitHub repository'):
+        get_repo_info()
+
+
+def test_get_repo_info_outside_repository(tmp_path, monkeypatch):
+    """Test running outside a git repository is reported as a ValueError."""
+    monkeypatch.chdir(tmp_path)
+    with pytest.raises(ValueError, match='not a git repository'):
+        get_repo_info()
+
+
+def test_get_repo_info_in_subdirectory(git_dir, monkeypatch):
+    """Test a subdirectory of a repository is rejected, matching check_git_repo."""
+    add_remote('origin', 'git@github.com:test-owner/test-repo.git')
+    (git_dir / 'sub').mkdir()
+    monkeypatch.chdir(git_dir / 'sub')
+    assert not check_git_repo()
+    with pytest.raises(ValueError, match='not a git repository'):
+        get_repo_info()
+
+
+def test_get_repo_info_without_git_executable(git_dir):
+    """Test the origin URL is read through GitPython when git is not on PATH."""
+    add_remote('origin', 'https://github.com/test-owner/test-repo.git')
+    with patch('voyager.utils.subprocess.run', side_effect=FileNotFoundError('git')):
+        assert get_repo_info() == ('test-owner', 'test-repo')
+
+
+def test_check_git_repo(git_dir):
+    """Test the repository root is recognised as a git repository."""
+    assert check_git_repo()
+
+
+def test_check_git_repo_outside_repository(tmp_path, monkeypatch):
+    """Test a plain directory is not a git repository."""
+    monkeypatch.chdir(tmp_path)
+    assert not check_git_repo()
+
+
+def test_check_git_repo_strict(tmp_path, monkeypatch):
+    """Test the strict check opens the repository, so a broken .git is rejected."""
+    (tmp_path / '.git').mkdir()
+    monkeypatch.chdir(tmp_path)
+    assert check_git_repo()
+
+    monkeypatch.setenv('VOYAGER_STRICT_GIT_CHECK', '1')
+    assert not check_git_repo()